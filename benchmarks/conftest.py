@@ -0,0 +1,25 @@
+from typing import Iterator
+
+from pytest import Config, FixtureRequest, Parser, fixture
+
+from .memory import MemoryBaselines
+
+
+def pytest_addoption(parser: Parser) -> None:
+    parser.addoption(
+        "--memory-baselines-update",
+        action="store_true",
+        default=False,
+        help="Store the measured memory usage as the new baselines.",
+    )
+
+
+@fixture(scope="session")
+def memory_baselines(request: FixtureRequest) -> Iterator[MemoryBaselines]:
+    config: Config = request.config
+    memory_baselines = MemoryBaselines(
+        update=bool(config.getoption("--memory-baselines-update"))
+    )
+    yield memory_baselines
+    if memory_baselines.update:
+        memory_baselines.save()
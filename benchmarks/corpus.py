@@ -0,0 +1,166 @@
+import functools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import yaml
+
+from doc_printer import (
+    Alt,
+    Cat,
+    Doc,
+    DocRenderer,
+    Edit,
+    Fill,
+    Group,
+    Line,
+    Nest,
+    Row,
+    SimpleDocRenderer,
+    SimpleLayout,
+    SmartDocRenderer,
+    Table,
+    Text,
+    TextTable,
+    alt,
+    cat,
+    fill,
+    group,
+    nest,
+    row,
+    table,
+)
+
+GOLDEN: Path = Path(__file__).parent.parent / "tests" / "data" / "golden"
+
+RENDERERS: Tuple[str, ...] = ("simple", "smart80", "smart1k")
+
+ALIGNMENTS: Tuple[str, ...] = ("default", "align/dynamic", "align/fixed32")
+
+try:
+    # NOTE: The C loader is an order of magnitude faster than the pure Python
+    #       loader, which matters for a corpus of this size.
+    _Loader: Any = yaml.CSafeLoader
+except AttributeError:
+    _Loader = yaml.SafeLoader
+
+
+@dataclass
+class GoldenFile:
+    name: str
+    input: Dict[str, Any]
+    output: str
+
+    @property
+    def doc_dict(self) -> Dict[str, Any]:
+        return dict(self.input["doc"])
+
+    def doc_renderer(self) -> DocRenderer:
+        if self.input["renderer"] == "simple":
+            simple_layout = SimpleLayout[self.input["simple_layout"]]
+            return SimpleDocRenderer(simple_layout=simple_layout)
+        else:
+            max_line_width = int(self.input["max_line_width"])
+            return SmartDocRenderer(max_line_width=max_line_width)
+
+
+@functools.lru_cache(maxsize=None)
+def golden_files(renderer: str, alignment: str) -> Tuple[GoldenFile, ...]:
+    """
+    Load the golden files for a renderer and an alignment mode.
+    """
+    golden_files: List[GoldenFile] = []
+    for path in sorted((GOLDEN / renderer / alignment).glob("*.yml")):
+        with path.open(encoding="utf-8") as file:
+            golden = yaml.load(file, Loader=_Loader)
+        golden_files.append(
+            GoldenFile(
+                name=path.stem,
+                input=golden["input"],
+                output=golden["output"],
+            )
+        )
+    return tuple(golden_files)
+
+
+@functools.lru_cache(maxsize=None)
+def golden_docs(alignment: str) -> Dict[str, Doc]:
+    """
+    Load the documents for an alignment mode, indexed by name.
+
+    NOTE: The document for a name is the same for every renderer.
+    """
+    return {
+        golden_file.name: Doc.from_dict(golden_file.doc_dict)
+        for renderer in RENDERERS
+        for golden_file in golden_files(renderer, alignment)
+    }
+
+
+def count_nodes(doc: Doc) -> int:
+    """
+    Count the nodes in a document.
+    """
+    size: int = 0
+    stack: List[Doc] = [doc]
+    while stack:
+        doc = stack.pop()
+        size += 1
+        if isinstance(doc, (Cat, Alt, Fill, Row, Table)):
+            stack.extend(doc)
+        elif isinstance(doc, (Group, Nest, Edit)):
+            stack.append(doc.doc)
+        elif isinstance(doc, TextTable):
+            size += sum(map(len, doc.cells))
+    return size
+
+
+def rebuild(doc: Doc) -> Doc:
+    """
+    Rebuild a document using the construction helpers.
+    """
+    if isinstance(doc, Text):
+        return Text(doc.text)
+    if isinstance(doc, Cat):
+        return cat(map(rebuild, doc.docs))
+    if isinstance(doc, Alt):
+        return alt(map(rebuild, doc.alts))
+    if isinstance(doc, Group):
+        return group(rebuild(doc.doc))
+    if isinstance(doc, Fill):
+        return fill(map(rebuild, doc.docs))
+    if isinstance(doc, Nest):
+        return nest(doc.indent, rebuild(doc.doc), overlap=doc.overlap)
+    if isinstance(doc, Edit):
+        return Edit(doc.function, rebuild(doc.doc))
+    if isinstance(doc, Row):
+        return row(
+            map(rebuild, doc.cells),
+            table_type=doc.info.table_type,
+            hpad=doc.info.hpad,
+            hsep=doc.info.hsep,
+            min_col_widths=doc.info.min_col_widths,
+            align_window=doc.info.align_window,
+        )
+    if isinstance(doc, Table):
+        rows = map(rebuild, doc.rows)
+        return table(
+            (row for row in rows if isinstance(row, Row)),
+            align_window=doc.align_window,
+        )
+    return doc
+
+
+def untable(doc: Doc) -> Iterator[Doc]:
+    """
+    Undo create_tables, by replacing each table with the rows it was
+    created from.
+    """
+    docs = doc.docs if isinstance(doc, Cat) else (doc,)
+    for subdoc in docs:
+        if isinstance(subdoc, Alt) and isinstance(subdoc.alts[-1], Table):
+            fallback = subdoc.alts[0]
+            rows = fallback.docs if isinstance(fallback, Cat) else (fallback,)
+            yield from (row for row in rows if row is not Line)
+        else:
+            yield subdoc
@@ -0,0 +1,118 @@
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+BASELINES: Path = Path(__file__).parent / "memory_baselines.json"
+
+# NOTE: The benchmarks fail if the memory usage exceeds the baseline by more
+#       than this fraction.
+THRESHOLD: float = 0.10
+
+
+@dataclass
+class MemoryUsage:
+    """
+    The memory usage of a benchmark.
+
+    The peak is the maximum number of bytes allocated at any one time, and
+    the retained blocks are the number of memory blocks allocated by the
+    benchmark that are still alive when it returns, once its garbage is
+    collected, e.g., those held by its result. The blocks that it allocates
+    and frees again are not counted.
+    """
+
+    peak: int = 0
+    retained_blocks: int = 0
+
+    def __add__(self, other: "MemoryUsage") -> "MemoryUsage":
+        return MemoryUsage(
+            self.peak + other.peak, self.retained_blocks + other.retained_blocks
+        )
+
+
+def trace(function: Callable[[], T]) -> Tuple[T, MemoryUsage]:
+    """
+    Call a function and trace its memory usage.
+
+    NOTE: The function is called once before it is traced, so that caches
+          populated on the first call are not counted. The collector does
+          not run during the call, and the garbage is collected before the
+          snapshot, so that neither the peak nor the retained blocks depend
+          on when the collector runs. The objects that existed before the
+          call are frozen, so that the collection skips them.
+    """
+    function()
+    gc.freeze()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+        gc.unfreeze()
+    retained_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return (result, MemoryUsage(peak, retained_blocks))
+
+
+def python_version() -> str:
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+@dataclass
+class MemoryBaselines:
+    """
+    The stored memory usage for each benchmark.
+
+    The memory usage depends on the Python version, so the baselines are
+    stored separately for each version.
+    """
+
+    path: Path = BASELINES
+    update: bool = False
+    baselines: Dict[str, Dict[str, Dict[str, int]]] = field(default_factory=dict)
+
+    def __post_init__(self, **rest: Any) -> None:
+        if self.path.exists():
+            self.baselines = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def has_baseline(self, key: str) -> bool:
+        return key in self.baselines.get(python_version(), {})
+
+    def check(self, key: str, memory_usage: MemoryUsage) -> List[str]:
+        """
+        Check the memory usage against its baseline, and return a list of
+        regressions. If updating, store the memory usage as the baseline.
+        """
+        baselines = self.baselines.setdefault(python_version(), {})
+        if self.update:
+            baselines[key] = {
+                "peak": memory_usage.peak,
+                "retained_blocks": memory_usage.retained_blocks,
+            }
+            return []
+        regressions: List[str] = []
+        baseline = baselines[key]
+        for metric in ("peak", "retained_blocks"):
+            actual = getattr(memory_usage, metric)
+            if actual > baseline[metric] * (1 + THRESHOLD):
+                regressions.append(
+                    f"{key}: {metric} of {actual} exceeds the baseline of "
+                    f"{baseline[metric]} by more than {THRESHOLD:.0%}"
+                )
+        return regressions
+
+    def save(self) -> None:
+        self.path.write_text(
+            json.dumps(self.baselines, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
@@ -0,0 +1,163 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from doc_printer import (
+    Doc,
+    Line,
+    Row,
+    SoftLine,
+    Text,
+    alt,
+    cat,
+    fill,
+    group,
+    nest,
+    row,
+    table,
+)
+
+
+def alt_depth(n: int) -> Doc:
+    """
+    Create a document with n nested alternatives.
+    """
+    doc: Doc = Text("x")
+    for _ in range(n):
+        doc = alt(cat("(", Line, nest(2, doc), Line, ")"), cat("(", doc, ")"))
+    return doc
+
+
+def softline_length(n: int) -> Doc:
+    """
+    Create a document with n words separated by soft line breaks.
+    """
+    return SoftLine.join(Text(f"w{i}") for i in range(n))
+
+
+def fill_length(n: int) -> Doc:
+    """
+    Create a document with n words that are filled.
+    """
+    return fill(Text(f"w{i}") for i in range(n))
+
+
+def group_length(n: int) -> Doc:
+    """
+    Create a document with n groups separated by soft line breaks.
+    """
+    return SoftLine.join(
+        group(cat(f"f{i}(", Line, f"a{i},", Line, f"b{i}", Line, ")")) for i in range(n)
+    )
+
+
+def nest_depth(n: int) -> Doc:
+    """
+    Create a document with n nested indentation levels.
+    """
+    doc: Doc = Text("x")
+    for _ in range(n):
+        doc = cat("a", nest(2, Line, doc))
+    return doc
+
+
+def table_shape(n_rows: int, n_cols: int) -> Doc:
+    """
+    Create a table with n_rows rows and n_cols columns.
+    """
+    rows = (row(*(f"c{i}.{j}" for j in range(n_cols))) for i in range(n_rows))
+    return table(row for row in rows if isinstance(row, Row))
+
+
+def table_rows(n: int) -> Doc:
+    """
+    Create a table with n rows and 4 columns.
+    """
+    return table_shape(n, 4)
+
+
+def table_cols(n: int) -> Doc:
+    """
+    Create a table with 4 rows and n columns.
+    """
+    return table_shape(4, n)
+
+
+@dataclass
+class Workload:
+    """
+    A family of synthetic documents, parameterized by their size.
+
+    The exponents bound the growth of the render time and the peak memory
+    as a function of the size, i.e., time is in O(n ** time_exponent).
+    The exponential size, if any, is beyond the sizes with such a bound, and
+    is only rendered within a time budget.
+    """
+
+    generate: Callable[[int], Doc]
+    sizes: Tuple[int, ...]
+    time_exponent: float = 1.0
+    memory_exponent: float = 1.0
+    known_issue: Optional[str] = None
+    exponential_size: Optional[int] = None
+
+
+WORKLOADS: Dict[str, Workload] = {
+    "alt_depth": Workload(
+        alt_depth,
+        sizes=(16, 32, 64, 128),
+        # NOTE: Each level renders its body again, when an alternative fails.
+        time_exponent=2.0,
+        # NOTE: From about 160 levels on, the failures of the inner levels
+        #       compound, and the render time is exponential.
+        exponential_size=192,
+    ),
+    "softline_length": Workload(
+        softline_length,
+        sizes=(1000, 2000, 4000, 8000),
+    ),
+    "fill_length": Workload(
+        fill_length,
+        sizes=(1000, 2000, 4000, 8000),
+    ),
+    "group_length": Workload(
+        group_length,
+        sizes=(500, 1000, 2000, 4000),
+    ),
+    "nest_depth": Workload(
+        nest_depth,
+        # NOTE: Below about 80 levels, the cubic term is too small to exceed
+        #       the tolerance reliably.
+        sizes=(40, 80, 160, 320),
+        # NOTE: The size of the output grows quadratically with the depth.
+        time_exponent=2.0,
+        memory_exponent=2.0,
+        known_issue="Nest buffers the tokens of its body at every level",
+    ),
+    "table_rows": Workload(
+        table_rows,
+        sizes=(500, 1000, 2000, 4000),
+    ),
+    "table_cols": Workload(
+        table_cols,
+        sizes=(500, 1000, 2000, 4000),
+    ),
+}
+
+
+def fit_exponent(sizes: Sequence[float], values: Sequence[float]) -> float:
+    """
+    Fit a power law to the values, and return its exponent, i.e., the slope
+    of the least-squares fit of log(value) against log(size).
+    """
+    assert len(sizes) == len(values) >= 2
+    log_sizes = [math.log(size) for size in sizes]
+    log_values = [math.log(max(value, 1e-9)) for value in values]
+    mean_log_size = sum(log_sizes) / len(log_sizes)
+    mean_log_value = sum(log_values) / len(log_values)
+    covariance = sum(
+        (log_size - mean_log_size) * (log_value - mean_log_value)
+        for log_size, log_value in zip(log_sizes, log_values)
+    )
+    variance = sum((log_size - mean_log_size) ** 2 for log_size in log_sizes)
+    return covariance / variance
@@ -0,0 +1,173 @@
+import pickle
+from typing import Any, Callable, Dict, List, Sequence
+
+from pytest import mark
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from doc_printer import Doc, SmartDocRenderer, create_tables
+
+from .corpus import (
+    ALIGNMENTS,
+    RENDERERS,
+    count_nodes,
+    golden_docs,
+    golden_files,
+    rebuild,
+    untable,
+)
+
+
+def run_benchmark(
+    benchmark: BenchmarkFixture,
+    function: Callable[[], Any],
+    *,
+    group: str,
+    n_nodes: int,
+    n_bytes: int = 0,
+) -> Any:
+    """
+    Benchmark a function over the whole corpus, and record its throughput.
+    """
+    benchmark.group = group
+    result = benchmark(function)
+    benchmark.extra_info["nodes"] = n_nodes
+    benchmark.extra_info["bytes"] = n_bytes
+    if not benchmark.disabled and benchmark.stats is not None:
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["nodes_per_second"] = n_nodes / mean
+        if n_bytes:
+            benchmark.extra_info["bytes_per_second"] = n_bytes / mean
+    return result
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_from_dict(benchmark: BenchmarkFixture, alignment: str) -> None:
+    docs = list(golden_docs(alignment).values())
+    doc_dicts = [doc.to_dict() for doc in docs]
+
+    def from_dict() -> List[Doc]:
+        return list(map(Doc.from_dict, doc_dicts))
+
+    assert (
+        run_benchmark(
+            benchmark,
+            from_dict,
+            group=f"from_dict/{alignment}",
+            n_nodes=sum(map(count_nodes, docs)),
+        )
+        == docs
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_pickle(benchmark: BenchmarkFixture, alignment: str) -> None:
+    docs = list(golden_docs(alignment).values())
+
+    def round_trip() -> List[Doc]:
+        return [pickle.loads(pickle.dumps(doc)) for doc in docs]
+
+    assert (
+        run_benchmark(
+            benchmark,
+            round_trip,
+            group=f"pickle/{alignment}",
+            n_nodes=sum(map(count_nodes, docs)),
+            n_bytes=sum(len(pickle.dumps(doc)) for doc in docs),
+        )
+        == docs
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_rebuild(benchmark: BenchmarkFixture, alignment: str) -> None:
+    docs = golden_docs(alignment).values()
+
+    def rebuild_all() -> List[Doc]:
+        return list(map(rebuild, docs))
+
+    run_benchmark(
+        benchmark,
+        rebuild_all,
+        group=f"rebuild/{alignment}",
+        n_nodes=sum(map(count_nodes, docs)),
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_create_tables(benchmark: BenchmarkFixture, alignment: str) -> None:
+    docs = golden_docs(alignment).values()
+    untabled_docs: Sequence[List[Doc]] = [list(untable(doc)) for doc in docs]
+
+    def create_tables_all() -> List[List[Doc]]:
+        return [list(create_tables(iter(subdocs))) for subdocs in untabled_docs]
+
+    run_benchmark(
+        benchmark,
+        create_tables_all,
+        group=f"create_tables/{alignment}",
+        n_nodes=sum(count_nodes(doc) for docs in untabled_docs for doc in docs),
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+@mark.parametrize("renderer", RENDERERS)
+def test_render(benchmark: BenchmarkFixture, renderer: str, alignment: str) -> None:
+    files = golden_files(renderer, alignment)
+    docs = golden_docs(alignment)
+    outputs: Dict[str, str] = {
+        golden_file.name: golden_file.output for golden_file in files
+    }
+
+    doc_renderers = [golden_file.doc_renderer() for golden_file in files]
+
+    def render() -> Dict[str, str]:
+        return {
+            golden_file.name: doc_renderer.to_str(docs[golden_file.name])
+            for golden_file, doc_renderer in zip(files, doc_renderers)
+        }
+
+    assert (
+        run_benchmark(
+            benchmark,
+            render,
+            group=f"{renderer}/{alignment}",
+            n_nodes=sum(count_nodes(docs[golden_file.name]) for golden_file in files),
+            n_bytes=sum(len(output.encode("utf-8")) for output in outputs.values()),
+        )
+        == outputs
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_render_widths(benchmark: BenchmarkFixture, alignment: str) -> None:
+    renderers = [renderer for renderer in RENDERERS if renderer.startswith("smart")]
+    docs = golden_docs(alignment)
+    outputs: Dict[str, List[str]] = {}
+    max_line_widths: Dict[str, List[int]] = {}
+    for renderer in renderers:
+        for golden_file in golden_files(renderer, alignment):
+            outputs.setdefault(golden_file.name, []).append(golden_file.output)
+            max_line_widths.setdefault(golden_file.name, []).append(
+                int(golden_file.input["max_line_width"])
+            )
+
+    def render() -> Dict[str, List[str]]:
+        return {
+            name: SmartDocRenderer().to_strs(docs[name], max_line_widths[name])
+            for name in outputs
+        }
+
+    assert (
+        run_benchmark(
+            benchmark,
+            render,
+            group=f"{'+'.join(renderers)}/{alignment}",
+            n_nodes=sum(count_nodes(docs[name]) for name in outputs),
+            n_bytes=sum(
+                len(output.encode("utf-8"))
+                for name in outputs
+                for output in outputs[name]
+            ),
+        )
+        == outputs
+    )
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# NOTE: The standard library modules that every program imports anyway are
+#       imported first, so that only the time spent importing doc_printer
+#       and its own dependencies is measured.
+PRELUDE: str = "import abc, contextlib, dataclasses, enum, itertools, re, typing"
+
+# NOTE: The budget is relative to the time spent importing dataclasses in a
+#       fresh interpreter, so that it does not depend on the machine. Here,
+#       importing doc_printer took about 2 to 3 times as long (55 to 80ms
+#       against 29ms), and about 6 times as long while it imported
+#       dataclasses_json.
+BUDGET_RATIO: float = 4.0
+
+
+def import_seconds(module: str = "doc_printer", prelude: str = PRELUDE) -> float:
+    """
+    Measure the cumulative time spent importing a module in a fresh
+    interpreter, after the prelude, as reported by `python -X importtime`.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{prelude}\nimport {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    for line in reversed(stderr.splitlines()):
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1_000_000
+    raise ValueError(f"{module} not found in:\n{stderr}")
+
+
+def test_import(benchmark: BenchmarkFixture) -> None:
+    benchmark.group = "import"
+    benchmark.pedantic(import_seconds, rounds=5)
+
+
+def test_import_budget() -> None:
+    # NOTE: The time of a single run is noisy, so the best of several runs
+    #       is compared against the budget.
+    seconds = min(import_seconds() for _ in range(5))
+    baseline = min(import_seconds("dataclasses", prelude="") for _ in range(5))
+    assert seconds <= BUDGET_RATIO * baseline, (
+        f"importing took {seconds * 1000:.1f}ms, "
+        f"and importing dataclasses took {baseline * 1000:.1f}ms"
+    )
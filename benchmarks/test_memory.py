@@ -0,0 +1,101 @@
+import functools
+from typing import Any, Callable, Iterable, List
+
+from pytest import mark, skip
+
+from doc_printer import Doc, create_tables
+
+from .corpus import (
+    ALIGNMENTS,
+    RENDERERS,
+    GoldenFile,
+    golden_docs,
+    golden_files,
+    rebuild,
+    untable,
+)
+from .memory import MemoryBaselines, MemoryUsage, python_version, trace
+
+
+def check_memory(
+    memory_baselines: MemoryBaselines,
+    key: str,
+    functions: Iterable[Callable[[], Any]],
+) -> None:
+    """
+    Trace the memory usage of each function, and check their total against
+    the stored baseline.
+    """
+    if not memory_baselines.update and not memory_baselines.has_baseline(key):
+        skip(f"No memory baseline for {key} on Python {python_version()}")
+    memory_usage = MemoryUsage()
+    for function in functions:
+        _, function_memory_usage = trace(function)
+        memory_usage += function_memory_usage
+    regressions = memory_baselines.check(key, memory_usage)
+    assert not regressions, "\n".join(regressions)
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_from_dict(memory_baselines: MemoryBaselines, alignment: str) -> None:
+    check_memory(
+        memory_baselines,
+        f"from_dict/{alignment}",
+        (
+            functools.partial(Doc.from_dict, doc.to_dict())
+            for doc in golden_docs(alignment).values()
+        ),
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_to_dict(memory_baselines: MemoryBaselines, alignment: str) -> None:
+    check_memory(
+        memory_baselines,
+        f"to_dict/{alignment}",
+        (doc.to_dict for doc in golden_docs(alignment).values()),
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_rebuild(memory_baselines: MemoryBaselines, alignment: str) -> None:
+    check_memory(
+        memory_baselines,
+        f"rebuild/{alignment}",
+        (functools.partial(rebuild, doc) for doc in golden_docs(alignment).values()),
+    )
+
+
+def create_tables_list(docs: List[Doc]) -> List[Doc]:
+    return list(create_tables(iter(docs)))
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+def test_create_tables(memory_baselines: MemoryBaselines, alignment: str) -> None:
+    check_memory(
+        memory_baselines,
+        f"create_tables/{alignment}",
+        (
+            functools.partial(create_tables_list, list(untable(doc)))
+            for doc in golden_docs(alignment).values()
+        ),
+    )
+
+
+@mark.parametrize("alignment", ALIGNMENTS)
+@mark.parametrize("renderer", RENDERERS)
+def test_render(
+    memory_baselines: MemoryBaselines, renderer: str, alignment: str
+) -> None:
+    docs = golden_docs(alignment)
+
+    def render(golden_file: GoldenFile) -> Callable[[], str]:
+        doc = docs[golden_file.name]
+        doc_renderer = golden_file.doc_renderer()
+        return lambda: doc_renderer.to_str(doc)
+
+    check_memory(
+        memory_baselines,
+        f"{renderer}/{alignment}",
+        map(render, golden_files(renderer, alignment)),
+    )
@@ -0,0 +1,117 @@
+import time
+import tracemalloc
+from typing import List, Tuple
+
+from pytest import mark, param
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from doc_printer import Doc, SimpleDocRenderer, SmartDocRenderer
+
+from .synthetic import WORKLOADS, fit_exponent
+
+MAX_LINE_WIDTH: int = 80
+
+# NOTE: Timings of small documents are noisy, so the fitted exponents may
+#       exceed their bound by this much.
+TOLERANCE: float = 0.35
+
+TIME_BUDGET: float = 0.1
+
+# NOTE: Once the budget runs out, the first alternatives are used, as in the
+#       simple renderer, so the rest of the render is bounded by its time.
+BUDGET_FACTOR: float = 5.0
+
+
+def measure(doc: Doc, *, repeat: int = 3) -> Tuple[float, int]:
+    """
+    Measure the best render time and the peak memory for a document.
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        SmartDocRenderer(max_line_width=MAX_LINE_WIDTH).to_str(doc)
+        seconds = min(seconds, time.perf_counter() - start)
+    # NOTE: The peak memory is measured separately, because tracing memory
+    #       allocations slows down rendering.
+    tracemalloc.start()
+    try:
+        SmartDocRenderer(max_line_width=MAX_LINE_WIDTH).to_str(doc)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (seconds, peak)
+
+
+@mark.parametrize(
+    "name,size",
+    [(name, size) for name, workload in WORKLOADS.items() for size in workload.sizes],
+)
+def test_render(benchmark: BenchmarkFixture, name: str, size: int) -> None:
+    doc = WORKLOADS[name].generate(size)
+    benchmark.group = f"scaling/{name}"
+    benchmark.extra_info["size"] = size
+    benchmark(lambda: SmartDocRenderer(max_line_width=MAX_LINE_WIDTH).to_str(doc))
+
+
+@mark.parametrize(
+    "name",
+    [
+        param(
+            name,
+            marks=(
+                [mark.xfail(reason=workload.known_issue, strict=True)]
+                if workload.known_issue
+                else []
+            ),
+        )
+        for name, workload in WORKLOADS.items()
+    ],
+)
+def test_growth(name: str) -> None:
+    workload = WORKLOADS[name]
+    seconds: List[float] = []
+    peaks: List[int] = []
+    for size in workload.sizes:
+        size_seconds, size_peak = measure(workload.generate(size))
+        seconds.append(size_seconds)
+        peaks.append(size_peak)
+    time_exponent = fit_exponent(workload.sizes, seconds)
+    memory_exponent = fit_exponent(workload.sizes, peaks)
+    assert time_exponent <= workload.time_exponent + TOLERANCE, (
+        f"{name}: render time grows as n ** {time_exponent:.2f}, "
+        f"expected at most n ** {workload.time_exponent:.2f}"
+    )
+    assert memory_exponent <= workload.memory_exponent + TOLERANCE, (
+        f"{name}: peak memory grows as n ** {memory_exponent:.2f}, "
+        f"expected at most n ** {workload.memory_exponent:.2f}"
+    )
+
+
+@mark.parametrize(
+    "name",
+    [
+        name
+        for name, workload in WORKLOADS.items()
+        if workload.exponential_size is not None
+    ],
+)
+def test_budget(name: str) -> None:
+    workload = WORKLOADS[name]
+    assert workload.exponential_size is not None
+    doc = workload.generate(workload.exponential_size)
+    simple_seconds = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        SimpleDocRenderer().to_str(doc)
+        simple_seconds = min(simple_seconds, time.perf_counter() - start)
+    smart = SmartDocRenderer(max_line_width=MAX_LINE_WIDTH, time_budget=TIME_BUDGET)
+    state = smart.new_render_state()
+    start = time.perf_counter()
+    for _ in smart.render_with_state(doc, state):
+        pass
+    seconds = time.perf_counter() - start
+    assert state.degraded
+    assert seconds <= TIME_BUDGET + BUDGET_FACTOR * simple_seconds, (
+        f"{name}: render took {seconds:.2f}s with a budget of {TIME_BUDGET}s, "
+        f"the simple renderer took {simple_seconds:.2f}s"
+    )
@@ -1,5 +1,10 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from .abc import DocRenderer as DocRenderer
+from .abc import LineWidthExceeded as LineWidthExceeded
 from .abc import OnEmit as OnEmit
+from .abc import OnEmitBatch as OnEmitBatch
 from .abc import RenderError as RenderError
 from .doc import Alt as Alt
 from .doc import Cat as Cat
@@ -8,6 +13,8 @@ from .doc import DocLike as DocLike
 from .doc import Edit as Edit
 from .doc import Empty as Empty
 from .doc import Fail as Fail
+from .doc import Fill as Fill
+from .doc import Group as Group
 from .doc import Line as Line
 from .doc import Nest as Nest
 from .doc import Row as Row
@@ -16,6 +23,7 @@ from .doc import SoftLine as SoftLine
 from .doc import Space as Space
 from .doc import Table as Table
 from .doc import Text as Text
+from .doc import TextTable as TextTable
 from .doc import Token as Token
 from .doc import TokenStream as TokenStream
 from .doc import Unknown as Unknown
@@ -28,14 +36,58 @@ from .doc import cat as cat
 from .doc import create_table as create_table
 from .doc import create_tables as create_tables
 from .doc import double_quote as double_quote
+from .doc import fill as fill
+from .doc import group as group
 from .doc import inline as inline
 from .doc import nest as nest
 from .doc import parens as parens
 from .doc import row as row
+from .doc import segments as segments
 from .doc import single_quote as single_quote
 from .doc import smart_quote as smart_quote
 from .doc import table as table
+from .doc import text_table as text_table
+from .doc import text_table_from_columns as text_table_from_columns
+from .incremental import IncrementalDocRenderer as IncrementalDocRenderer
+from .incremental import RenderUpdate as RenderUpdate
+from .simple import RenderState as RenderState
 from .simple import SimpleDocRenderer as SimpleDocRenderer
 from .simple import SimpleLayout as SimpleLayout
-from .smart import LineWidthExceeded as LineWidthExceeded
 from .smart import SmartDocRenderer as SmartDocRenderer
+from .stats import DocStats as DocStats
+from .stats import NodeStats as NodeStats
+from .stats import RenderStats as RenderStats
+from .stats import doc_stats as doc_stats
+
+__version__: str = "0.15.1"
+
+# NOTE: These modules import sqlite3, hashlib, json, and concurrent.futures,
+#       which are slow to import, so they are only imported when used.
+#       See PEP 562.
+if TYPE_CHECKING:
+    from .cache import CachedDocRenderer as CachedDocRenderer
+    from .cache import RenderCache as RenderCache
+    from .cache import content_key as content_key
+    from .parallel import ParallelDocRenderer as ParallelDocRenderer
+    from .parallel import SpeculativeDocRenderer as SpeculativeDocRenderer
+
+_LAZY_EXPORTS: Dict[str, str] = {
+    "CachedDocRenderer": ".cache",
+    "RenderCache": ".cache",
+    "content_key": ".cache",
+    "ParallelDocRenderer": ".parallel",
+    "SpeculativeDocRenderer": ".parallel",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name, None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
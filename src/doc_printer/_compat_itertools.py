@@ -2,9 +2,11 @@ import sys
 from itertools import chain as chain
 from itertools import groupby as groupby
 from itertools import repeat as repeat
-from typing import List
+from itertools import zip_longest as zip_longest
+from typing import Iterable, Iterator, List, TypeVar, Union
 
-from more_itertools import intersperse as intersperse
+_T = TypeVar("_T")
+_U = TypeVar("_U")
 
 ################################################################################
 # Export List
@@ -16,8 +18,28 @@ __all__: List[str] = [
     "groupby",
     "intersperse",
     "repeat",
+    "zip_longest",
 ]
 
+################################################################################
+# more_itertools.intersperse
+################################################################################
+
+# NOTE: more_itertools is slow to import, and only intersperse was used.
+
+
+def intersperse(separator: _U, iterable: Iterable[_T]) -> Iterator[Union[_T, _U]]:
+    "Insert the separator between each pair of elements."
+    # intersperse(0, [1,2,3]) --> 1 0 2 0 3
+    it = iter(iterable)
+    for element in it:
+        yield element
+        break
+    for element in it:
+        yield separator
+        yield element
+
+
 ################################################################################
 # Python 3.7: itertools.accumulate
 ################################################################################
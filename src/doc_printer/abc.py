@@ -1,5 +1,6 @@
 import abc
-from typing import Callable, Iterable
+import time
+from typing import AsyncGenerator, Callable, Generator, Iterable, List, Sequence
 
 from ._compat_itertools import chain
 from .doc import *
@@ -9,8 +10,22 @@ class RenderError(Exception):
     pass
 
 
+class LineWidthExceeded(Exception):
+    pass
+
+
 OnEmit = Callable[[Token], Token]
 
+OnEmitBatch = Callable[[Sequence[Token], int, int], None]
+
+# NOTE: A pausing render yields this token, whose text is empty, while it has
+#       no other tokens to yield, so that render_async can return control to
+#       the event loop. It is distinct from Empty.
+Pause: Token = Text.intern("Pause", text="")
+
+# NOTE: The number of steps of a render between pauses.
+_PAUSE_FRAMES: int = 256
+
 
 class DocRenderer(abc.ABC):
     def to_str(self, doc: Doc) -> str:
@@ -24,3 +39,58 @@ class DocRenderer(abc.ABC):
 
     def render_stream(self, docs: Iterable[Doc]) -> TokenStream:
         yield from chain.from_iterable(map(self.render, docs))
+
+    def render_pausing(self, doc: Doc, pause_frames: int) -> TokenStream:
+        """
+        Render a document as a stream of tokens, which yields Pause after
+        every pause_frames steps of the render, even if they produce no
+        tokens. By default, the render does not pause.
+        """
+        return self.render(doc)
+
+    async def to_str_async(
+        self, doc: Doc, *, chunk_size: int = 1024, interval: float = 0.005
+    ) -> str:
+        return "".join(
+            [
+                chunk
+                async for chunk in self.render_async(
+                    doc, chunk_size=chunk_size, interval=interval
+                )
+            ]
+        )
+
+    async def render_async(
+        self, doc: Doc, *, chunk_size: int = 1024, interval: float = 0.005
+    ) -> AsyncGenerator[str, None]:
+        """
+        Render a document as an asynchronous stream of strings.
+
+        Control is returned to the event loop after every chunk_size tokens,
+        or once rendering has taken interval seconds, whichever comes first,
+        including while a renderer that pauses produces no tokens.
+        """
+        # NOTE: asyncio is slow to import, and only needed here.
+        import asyncio
+
+        token_stream = self.render_pausing(doc, _PAUSE_FRAMES)
+        try:
+            buffer: List[str] = []
+            deadline = time.perf_counter() + interval
+            for token in token_stream:
+                if token is not Pause:
+                    buffer.append(token.text)
+                    if len(buffer) < chunk_size and time.perf_counter() < deadline:
+                        continue
+                elif time.perf_counter() < deadline:
+                    continue
+                if buffer:
+                    yield "".join(buffer)
+                    buffer.clear()
+                await asyncio.sleep(0)
+                deadline = time.perf_counter() + interval
+            if buffer:
+                yield "".join(buffer)
+        finally:
+            if isinstance(token_stream, Generator):
+                token_stream.close()
@@ -1,4 +1,5 @@
 import itertools
+from array import array
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
@@ -31,8 +32,9 @@ class CellBuffer(Iterable[Token]):
         self.buffer.append(token)
 
     def extend(self, tokens: Iterable[Token]) -> None:
-        for token in tokens:
-            self.append(token)
+        start = len(self.buffer)
+        self.buffer.extend(tokens)
+        self.min_width += sum(map(len, itertools.islice(self.buffer, start, None)))
 
     def render(self, *, padding: bool = True) -> TokenStream:
         yield from self.buffer
@@ -98,12 +100,17 @@ class TableBuffer:
     n_rows: int = field(default=0, init=False)
     buffer: List[RowBuffer] = field(default_factory=list, init=False)
     col_widths: Tuple[int, ...] = field(default_factory=tuple, init=False)
+    # NOTE: The widths are stored as one array per row for the cells, and one
+    #       array per row for the minimum column widths, so that update can
+    #       compute the column widths in a single pass.
+    cell_widths: List["array[int]"] = field(default_factory=list, init=False)
+    min_col_widths: List["array[int]"] = field(default_factory=list, init=False)
 
     def append(self, row: RowBuffer) -> None:
         self.n_cols = max(self.n_cols, row.min_n_cols)
         self.n_rows += 1
         self.buffer.append(row)
-        self.append_min_col_widths(tuple(cell.min_width for cell in row))
+        self.cell_widths.append(array("l", [cell.min_width for cell in row]))
         self.append_min_col_widths(row.min_col_widths)
 
     def extend(self, rows: Iterable[RowBuffer]) -> None:
@@ -111,23 +118,32 @@ class TableBuffer:
             self.append(row)
 
     def render(self) -> TokenStream:
-        for row in self:
-            yield from row.render()
+        col_widths = self.col_widths
+        for row, cell_widths in zip(self.buffer, self.cell_widths):
+            last = len(row.buffer) - 1
+            for j, cell in enumerate(row.buffer):
+                yield from cell.buffer
+                if j < last:
+                    yield from itertools.repeat(
+                        cell.hpad, col_widths[j] - cell_widths[j]
+                    )
+                    yield row.hsep
             yield Line
 
     def update(self) -> None:
-        for i in range(0, self.n_rows):
-            self.buffer[i].append_min_col_widths(self.col_widths)
-            self.buffer[i].update()
+        self.col_widths = tuple(
+            map(
+                max,
+                itertools.zip_longest(
+                    *self.cell_widths, *self.min_col_widths, fillvalue=0
+                ),
+            )
+        )
+        self.n_cols = max(self.n_cols, len(self.col_widths))
 
     def append_min_col_widths(self, min_col_widths: Tuple[Optional[int], ...]) -> None:
-        if not self.col_widths:
-            self.col_widths = tuple(w or 0 for w in min_col_widths)
-        else:
-            self.col_widths = tuple(
-                max(w1 or 0, w2 or 0)
-                for (w1, w2) in itertools.zip_longest(self.col_widths, min_col_widths)
-            )
+        if min_col_widths:
+            self.min_col_widths.append(array("l", [w or 0 for w in min_col_widths]))
 
     def __iter__(self) -> Iterator[RowBuffer]:
         return iter(self.buffer)
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Optional, Union
+
+from . import __version__
+from .abc import *
+from .doc import *
+from .smart import *
+
+
+def _without_none(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {
+            key: _without_none(value)
+            for key, value in data.items()
+            if value is not None
+        }
+    if isinstance(data, list):
+        return [_without_none(value) for value in data]
+    return data
+
+
+def _digest(data: Dict[str, Any]) -> str:
+    # NOTE: Entries whose value is None are dropped, because from_dict reads
+    #       them as if they were omitted.
+    text = json.dumps(_without_none(data), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def content_key(doc: Union[Doc, Dict[str, Any]]) -> str:
+    """
+    Compute a key for the content of a document or its dictionary.
+    """
+    if isinstance(doc, Doc):
+        doc = doc.to_dict()
+    return _digest(doc)
+
+
+# NOTE: Only these fields affect the output of a renderer. Other fields, such
+#       as the budgets, which only do if they run out, and then the output is
+#       not cached, or the statistics, are not part of the key. Renderers with
+#       callbacks, which may edit or reject tokens, bypass the cache.
+_CONFIG_FIELDS = (
+    "simple_layout",
+    "max_line_width",
+    "doc_renderer",
+)
+
+
+def _config(doc_renderer: DocRenderer) -> Dict[str, Any]:
+    cls = type(doc_renderer)
+    config: Dict[str, Any] = {"type": f"{cls.__module__}.{cls.__qualname__}"}
+    for name in _CONFIG_FIELDS:
+        value = getattr(doc_renderer, name, None)
+        config[name] = _config(value) if isinstance(value, DocRenderer) else value
+    return config
+
+
+def config_key(doc_renderer: DocRenderer) -> str:
+    """
+    Compute a key for the version of this package, and the class and
+    configuration of a renderer.
+    """
+    return _digest({"version": __version__, "config": _config(doc_renderer)})
+
+
+def _has_callbacks(doc_renderer: DocRenderer) -> bool:
+    if getattr(doc_renderer, "on_emit", None) or getattr(
+        doc_renderer, "on_emit_batch", None
+    ):
+        return True
+    if isinstance(doc_renderer, SimpleDocRenderer):
+        # NOTE: This includes the check of the line width in strict mode.
+        return bool(doc_renderer.new_render_state().on_emit_batch)
+    inner = getattr(doc_renderer, "doc_renderer", None)
+    return isinstance(inner, DocRenderer) and _has_callbacks(inner)
+
+
+@dataclass
+class RenderCache:
+    """
+    A persistent cache from keys to rendered documents, stored in
+    an SQLite database. Once the total size of the cached output exceeds
+    max_size characters, the least recently used entries are evicted.
+
+    The total size is computed when the cache is opened, and then kept up
+    to date, so it does not count entries put by other connections.
+
+    The cache may be shared by threads, which take turns using the
+    connection.
+    """
+
+    # NOTE: The access times are a counter, rather than a clock, so that
+    #       the order of accesses is exact.
+    NEXT_ACCESSED: ClassVar[str] = (
+        "(SELECT COALESCE(MAX(accessed), 0) + 1 FROM renders)"
+    )
+
+    path: Union[str, "os.PathLike[str]"]
+    max_size: int = 64 * 1024 * 1024
+    size: int = field(default=0, init=False)
+    connection: sqlite3.Connection = field(init=False, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self, **rest: Any) -> None:
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS renders ("
+                "key TEXT PRIMARY KEY, output TEXT, size INTEGER, accessed INTEGER)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS renders_accessed ON renders (accessed)"
+            )
+            (self.size,) = self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM renders"
+            ).fetchone()
+
+    def get(self, key: str) -> Optional[str]:
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                "SELECT output FROM renders WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                f"UPDATE renders SET accessed = {self.NEXT_ACCESSED} WHERE key = ?",
+                (key,),
+            )
+        return str(row[0])
+
+    def put(self, key: str, output: str) -> None:
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                "SELECT size FROM renders WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self.size -= row[0]
+            self.connection.execute(
+                "INSERT OR REPLACE INTO renders "
+                f"VALUES (?, ?, ?, {self.NEXT_ACCESSED})",
+                (key, output, len(output)),
+            )
+            self.size += len(output)
+            if self.size > self.max_size:
+                self.evict()
+
+    def evict(self) -> None:
+        # NOTE: Only the sizes of the entries that are evicted are read, in
+        #       order of access, and then they are deleted at once.
+        count: int = 0
+        cursor = self.connection.execute("SELECT size FROM renders ORDER BY accessed")
+        for (key_size,) in cursor:
+            if self.size <= self.max_size:
+                break
+            self.size -= key_size
+            count += 1
+        cursor.close()
+        self.connection.execute(
+            "DELETE FROM renders WHERE key IN "
+            "(SELECT key FROM renders ORDER BY accessed LIMIT ?)",
+            (count,),
+        )
+
+    def clear(self) -> None:
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM renders")
+            self.size = 0
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+@dataclass
+class CachedDocRenderer(DocRenderer):
+    """
+    Render documents using a persistent cache.
+
+    Only to_str and to_str_from_dict consult the cache, and only if the
+    renderer has no callbacks.
+    """
+
+    cache: RenderCache
+    doc_renderer: DocRenderer = field(default_factory=SmartDocRenderer)
+
+    def render(self, doc: Doc) -> TokenStream:
+        yield from self.doc_renderer.render(doc)
+
+    def to_str(self, doc: Doc) -> str:
+        return self.cached(doc)
+
+    def to_str_from_dict(self, kvs: Dict[str, Any]) -> str:
+        """
+        Render a document from its dictionary, skipping Doc.from_dict
+        entirely if the output is cached.
+        """
+        return self.cached(kvs)
+
+    def key(self, doc: Union[Doc, Dict[str, Any]]) -> str:
+        return f"{config_key(self.doc_renderer)}:{content_key(doc)}"
+
+    def cached(self, doc: Union[Doc, Dict[str, Any]]) -> str:
+        if _has_callbacks(self.doc_renderer):
+            if not isinstance(doc, Doc):
+                doc = Doc.from_dict(doc)
+            return self.doc_renderer.to_str(doc)
+        key = self.key(doc)
+        output = self.cache.get(key)
+        if output is None:
+            if not isinstance(doc, Doc):
+                doc = Doc.from_dict(doc)
+            # NOTE: The output of a render that ran out of its budget depends
+            #       on its timing, so it is not cached. The render has its own
+            #       state, so that it is not confused with concurrent renders.
+            doc_renderer = self.doc_renderer
+            if isinstance(doc_renderer, SimpleDocRenderer):
+                state = doc_renderer.new_render_state()
+                token_stream = doc_renderer.render_with_state(doc, state)
+                output = "".join(token.text for token in token_stream)
+                if not state.degraded:
+                    self.cache.put(key, output)
+            else:
+                output = doc_renderer.to_str(doc)
+                self.cache.put(key, output)
+        return output
@@ -1,4 +1,5 @@
 import abc
+import dataclasses
 import re
 import sys
 from dataclasses import dataclass
@@ -12,16 +13,16 @@ from typing import (
     List,
     Optional,
     Pattern,
+    Sequence,
     Tuple,
     Type,
     Union,
     cast,
 )
 
-from dataclasses_json import DataClassJsonMixin
 from typing_extensions import TypeAlias
 
-from ._compat_itertools import accumulate, groupby, intersperse
+from ._compat_itertools import accumulate, groupby, intersperse, zip_longest
 
 DocLike: TypeAlias = Optional[Union[str, "Doc", Iterable["DocLike"]]]
 
@@ -88,6 +89,28 @@ Unknown: WidthHint = WidthHint.intern_Unknown()
 
 
 class Doc(metaclass=abc.ABCMeta):
+    # NOTE: The fingerprint is computed once, when the document is constructed,
+    #       from the fingerprints of its children. Documents with different
+    #       fingerprints are never equal. Fingerprints are only comparable
+    #       within the same process.
+    fingerprint: int
+
+    def __hash__(self) -> int:
+        return self.fingerprint
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
+        assert isinstance(other, Doc)
+        if self.fingerprint != other.fingerprint:
+            return False
+        return all(
+            getattr(self, doc_field.name) == getattr(other, doc_field.name)
+            for doc_field in dataclasses.fields(self)  # type: ignore[arg-type]
+        )
+
     def then(self, other: DocLike) -> "Doc":
         """
         Compose two documents.
@@ -116,6 +139,15 @@ class Doc(metaclass=abc.ABCMeta):
     def to_dict(self) -> Dict[str, Any]:
         pass
 
+    # NOTE: Documents are pickled as their fields, and their fingerprints are
+    #       recomputed in the process that unpickles them. The singletons are
+    #       pickled by name, so that they are unpickled as the same objects.
+    #       Subdocuments that are shared are pickled once, by the memo of the
+    #       pickler.
+    @abc.abstractmethod
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        pass
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Doc":
         type_name = kvs["type"]
@@ -125,6 +157,10 @@ class Doc(metaclass=abc.ABCMeta):
             return Cat.from_dict(kvs)
         if type_name in ["Alt", "Fail", "SoftLine"]:
             return Alt.from_dict(kvs)
+        if type_name in ["Group"]:
+            return Group.from_dict(kvs)
+        if type_name in ["Fill"]:
+            return Fill.from_dict(kvs)
         if type_name in ["Nest"]:
             return Nest.from_dict(kvs)
         if type_name in ["Edit"]:
@@ -133,6 +169,8 @@ class Doc(metaclass=abc.ABCMeta):
             return Row.from_dict(kvs)
         if type_name in ["Table"]:
             return Table.from_dict(kvs)
+        if type_name in ["TextTable"]:
+            return TextTable.from_dict(kvs)
         raise ValueError(kvs)
 
     def __truediv__(self, other: DocLike) -> "Doc":
@@ -181,12 +219,34 @@ class Doc(metaclass=abc.ABCMeta):
         return alt(other, self)
 
 
+_FIELD_NAMES: Dict[Type[Doc], Tuple[str, ...]] = {}
+
+
+def _unpickle(cls: Type[Doc], *values: Any) -> Doc:
+    """
+    Recreate a pickled document from the values of its fields.
+    """
+    # NOTE: The invariants held when the document was pickled, so they are not
+    #       checked again. Each fingerprint is the hash of the type and fields.
+    field_names = _FIELD_NAMES.get(cls, None)
+    if field_names is None:
+        field_names = tuple(
+            doc_field.name
+            for doc_field in dataclasses.fields(cls)  # type: ignore[arg-type]
+        )
+        _FIELD_NAMES[cls] = field_names
+    doc = object.__new__(cls)
+    doc.__dict__.update(zip(field_names, values))
+    doc.__dict__["fingerprint"] = hash((cls, *values))
+    return doc
+
+
 ################################################################################
 # Text and Tokens
 ################################################################################
 
 
-@dataclass
+@dataclass(eq=False)
 class Text(Doc):
     """
     A single line of text.
@@ -205,6 +265,14 @@ class Text(Doc):
             pattern = cls.RE_ONE_WHITESPACE
         return Space.join(map(Text, pattern.split(text)))
 
+    @classmethod
+    def fill_words(cls, text: str, *, collapse_whitespace: bool = False) -> Doc:
+        if collapse_whitespace:
+            pattern = cls.RE_ANY_WHITESPACE
+        else:
+            pattern = cls.RE_ONE_WHITESPACE
+        return fill(map(Text, pattern.split(text)))
+
     @classmethod
     def lines(cls, text: str, *, collapse_whitespace: bool = False) -> Doc:
         return Line.join(
@@ -217,6 +285,7 @@ class Text(Doc):
         if not hasattr(cls, name):
             instance = super().__new__(Text)
             object.__setattr__(instance, "text", text)
+            object.__setattr__(instance, "fingerprint", hash((Text, text)))
             setattr(cls, name, instance)
         return cast(Text, getattr(cls, name))
 
@@ -250,6 +319,7 @@ class Text(Doc):
             return cls.intern_Line()
         instance = super().__new__(Text)
         object.__setattr__(instance, "text", text)
+        object.__setattr__(instance, "fingerprint", hash((Text, text)))
         return instance
 
     def __init__(self, text: str) -> None:
@@ -289,6 +359,15 @@ class Text(Doc):
             return {"type": "Line"}
         return {"type": "Text", "text": self.text}
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        if self.is_Empty():
+            return "Empty"
+        if self.is_Space():
+            return "Space"
+        if self.is_Line():
+            return "Line"
+        return (_unpickle, (Text, self.text))
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Text":
         type_name = kvs.get("type", None)
@@ -322,7 +401,7 @@ TokenStream: TypeAlias = Iterator[Token]
 ################################################################################
 
 
-@dataclass
+@dataclass(eq=False)
 class Cat(Doc, Iterable[Doc]):
     """
     Concatenated documents.
@@ -339,6 +418,7 @@ class Cat(Doc, Iterable[Doc]):
         assert all(
             doc is not Empty for doc in self.docs
         ), f"Cat contains Empty:\n{repr(self)}"
+        self.fingerprint = hash((Cat, self.docs))
 
     def __iter__(self) -> Iterator[Doc]:
         return iter(self.docs)
@@ -361,6 +441,9 @@ class Cat(Doc, Iterable[Doc]):
             "docs": [doc.to_dict() for doc in self.docs],
         }
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (_unpickle, (Cat, self.docs))
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Cat":
         docs = kvs.get("docs", None)
@@ -406,6 +489,26 @@ def cat(*doclike: DocLike) -> "Doc":
     return Cat(docs)
 
 
+def segments(doc: Doc) -> Iterator[Doc]:
+    """
+    Split a document after each of its top-level newlines.
+
+    Every segment but the first starts at column zero, and the layout of a
+    segment does not depend on the segments around it, so the segments can
+    be rendered independently and concatenated.
+    """
+    if isinstance(doc, Cat):
+        start: int = 0
+        for end, subdoc in enumerate(doc.docs, start=1):
+            if subdoc is Line:
+                yield cat(doc.docs[start:end])
+                start = end
+        if start < len(doc.docs):
+            yield cat(doc.docs[start:])
+    else:
+        yield doc
+
+
 def parens(*doclike: DocLike) -> Doc:
     return cat("(", doclike, ")")
 
@@ -427,7 +530,7 @@ def angles(*doclike: DocLike) -> Doc:
 ################################################################################
 
 
-@dataclass
+@dataclass(eq=False)
 class Alt(Doc, Iterable[Doc]):
     """
     Alternatives for the document layout.
@@ -441,6 +544,7 @@ class Alt(Doc, Iterable[Doc]):
         if not hasattr(cls, name):
             instance = super().__new__(Alt)
             object.__setattr__(instance, "alts", alts)
+            object.__setattr__(instance, "fingerprint", hash((Alt, alts)))
             setattr(cls, name, instance)
         return cast(Alt, getattr(cls, name))
 
@@ -465,6 +569,7 @@ class Alt(Doc, Iterable[Doc]):
             return cls.intern_SoftLine()
         instance = super().__new__(Alt)
         object.__setattr__(instance, "alts", alts)
+        object.__setattr__(instance, "fingerprint", hash((Alt, alts)))
         return instance
 
     def __init__(self, alts: Tuple[Doc, ...]):
@@ -500,6 +605,13 @@ class Alt(Doc, Iterable[Doc]):
             "alts": [doc.to_dict() for doc in self.alts],
         }
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        if self.is_Fail():
+            return "Fail"
+        if self.is_SoftLine():
+            return "SoftLine"
+        return (_unpickle, (Alt, self.alts))
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Alt":
         type_name = kvs.get("type", None)
@@ -528,12 +640,122 @@ def alt(*doclike: DocLike) -> Doc:
         return Alt(alts)
 
 
+@dataclass(eq=False)
+class Group(Doc):
+    """
+    A document that is laid out flat, with its Lines removed, if it fits,
+    and is broken, as it is, otherwise.
+
+    This differs from alt(doc, inline(doc)) in its flat layout, which is
+    rendered directly, without buffering. The Alts inside it are chosen by
+    their width once flattened, and the Nests inside it indent nothing, so
+    the indentation after a removed Line is removed as well. For instance,
+    the flat layout of cat("a", nest(2, Line, "b")) is "ab", rather than
+    "a  b" as for inline.
+    """
+
+    doc: Doc
+
+    def __post_init__(self, **rest: Any) -> None:
+        # Invariant: The doc is not Group
+        assert not isinstance(self.doc, Group), f"Group contains Group:\n{repr(self)}"
+        # Invariant: The doc is not Empty
+        assert self.doc is not Empty, f"Group contains Empty:\n{repr(self)}"
+        self.fingerprint = hash((Group, self.doc))
+
+    @property
+    def width_hint(self) -> WidthHint:
+        return self.doc.width_hint
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "Group",
+            "doc": self.doc.to_dict(),
+        }
+
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (_unpickle, (Group, self.doc))
+
+    @staticmethod
+    def from_dict(kvs: Dict[str, Any]) -> "Group":
+        doc = kvs.get("doc", None)
+        if doc is not None:
+            return Group(Doc.from_dict(doc))
+        raise ValueError(kvs)
+
+
+def group(*doclike: DocLike) -> Doc:
+    doc = cat(doclike)
+    if doc is Empty or isinstance(doc, Group):
+        return doc
+    return Group(doc)
+
+
+@dataclass(eq=False)
+class Fill(Doc, Iterable[Doc]):
+    """
+    Documents separated by soft lines, which are filled greedily.
+
+    This is like SoftLine.join(docs), except that each separator is chosen
+    from the current column, without trying the Space in strict mode, so a
+    paragraph of words is filled in a single pass.
+    """
+
+    docs: Tuple[Doc, ...]
+
+    def __post_init__(self, **rest: Any) -> None:
+        # Invariant: None of docs is an instance of Fill.
+        assert all(
+            not isinstance(doc, Fill) for doc in self.docs
+        ), f"Fill contains Fill:\n{repr(self)}"
+        # Invariant: None of docs is Empty.
+        assert all(
+            doc is not Empty for doc in self.docs
+        ), f"Fill contains Empty:\n{repr(self)}"
+        self.fingerprint = hash((Fill, self.docs))
+
+    def __iter__(self) -> Iterator[Doc]:
+        return iter(self.docs)
+
+    @property
+    def width_hint(self) -> WidthHint:
+        if self.docs:
+            return self.docs[0].width_hint
+        else:
+            return Unknown
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "Fill",
+            "docs": [doc.to_dict() for doc in self.docs],
+        }
+
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (_unpickle, (Fill, self.docs))
+
+    @staticmethod
+    def from_dict(kvs: Dict[str, Any]) -> "Fill":
+        docs = kvs.get("docs", None)
+        if docs is not None:
+            return Fill(docs=tuple(map(Doc.from_dict, docs)))
+        raise ValueError(kvs)
+
+
+def fill(*doclike: DocLike) -> Doc:
+    docs = tuple(doc for doc in splat(doclike, unpack=Fill) if doc is not Empty)
+    if not docs:
+        return Empty
+    if len(docs) == 1:
+        return docs[0]
+    return Fill(docs)
+
+
 ################################################################################
 # Nesting and Indentation
 ################################################################################
 
 
-@dataclass
+@dataclass(eq=False)
 class Nest(Doc):
     """
     Indented documents.
@@ -550,6 +772,7 @@ class Nest(Doc):
         assert self.doc is not Empty, f"Nest contains Empty:\n{repr(self)}"
         # Invariant: The indent is greater than zero.
         assert self.indent > 0, f"Nest has negative or zero indent:\n{repr(self)}"
+        self.fingerprint = hash((Nest, self.indent, self.doc, self.overlap))
 
     @property
     def width_hint(self) -> WidthHint:
@@ -567,6 +790,9 @@ class Nest(Doc):
             "doc": self.doc.to_dict(),
         }
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (_unpickle, (Nest, self.indent, self.doc, self.overlap))
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Nest":
         indent = kvs.get("indent", None)
@@ -660,11 +886,14 @@ def _decode_edit_function(
     raise ValueError(name)
 
 
-@dataclass
+@dataclass(eq=False)
 class Edit(Doc):
     function: Callable[[TokenStream], TokenStream]
     doc: Doc
 
+    def __post_init__(self, **rest: Any) -> None:
+        self.fingerprint = hash((Edit, self.function, self.doc))
+
     @property
     def width_hint(self) -> WidthHint:
         # NOTE: function should not significantly alter the width
@@ -677,6 +906,10 @@ class Edit(Doc):
             "doc": self.doc.to_dict(),
         }
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        # NOTE: The function is pickled by reference.
+        return (_unpickle, (Edit, self.function, self.doc))
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Edit":
         function = kvs.get("function", None)
@@ -756,15 +989,57 @@ def inline(doc: Doc) -> Doc:
 ################################################################################
 
 
-@dataclass
-class RowInfo(DataClassJsonMixin):  # type: ignore[misc]
+@dataclass(frozen=True)
+class RowInfo:
     table_type: Optional[str]
     hpad: Text
     hsep: Text
     min_col_widths: Tuple[Optional[int], ...]
+    align_window: Optional[int] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "table_type": self.table_type,
+            "hpad": {"text": self.hpad.text},
+            "hsep": {"text": self.hsep.text},
+            "min_col_widths": list(self.min_col_widths),
+            "align_window": self.align_window,
+        }
 
-@dataclass
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (
+            RowInfo,
+            (
+                self.table_type,
+                self.hpad,
+                self.hsep,
+                self.min_col_widths,
+                self.align_window,
+            ),
+        )
+
+    @staticmethod
+    def from_dict(kvs: Dict[str, Any]) -> "RowInfo":
+        hpad = kvs.get("hpad", None)
+        hsep = kvs.get("hsep", None)
+        min_col_widths = kvs.get("min_col_widths", None)
+        if (
+            "table_type" in kvs
+            and hpad is not None
+            and hsep is not None
+            and min_col_widths is not None
+        ):
+            return RowInfo(
+                table_type=kvs["table_type"],
+                hpad=Text(hpad["text"]),
+                hsep=Text(hsep["text"]),
+                min_col_widths=tuple(min_col_widths),
+                align_window=kvs.get("align_window", None),
+            )
+        raise ValueError(kvs)
+
+
+@dataclass(eq=False)
 class Row(Doc, Iterable[Doc]):
     cells: Tuple[Doc, ...]
     info: RowInfo
@@ -779,6 +1054,7 @@ class Row(Doc, Iterable[Doc]):
         assert (
             len(self.info.hpad.text) == 1
         ), f"Row hpad is more than one character:\n'{repr(self)}'"
+        self.fingerprint = hash((Row, self.cells, self.info))
 
     def __iter__(self) -> Iterator[Doc]:
         return iter(self.cells)
@@ -799,6 +1075,9 @@ class Row(Doc, Iterable[Doc]):
             "info": self.info.to_dict(),
         }
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (_unpickle, (Row, self.cells, self.info))
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Row":
         cells = kvs.get("cells", None)
@@ -811,19 +1090,43 @@ class Row(Doc, Iterable[Doc]):
         raise ValueError(kvs)
 
 
-@dataclass
+@dataclass(eq=False)
 class Table(Doc, Iterable[Row]):
     rows: Tuple[Row, ...]
+    align_window: Optional[int] = None
 
     def __post_init__(self, **rest: Any) -> None:
         # Invariant: All of rows are an instance of Table.
         assert all(
             isinstance(row, Row) for row in self.rows
         ), f"Table contains non-Row:\n{repr(self)}"
+        # Invariant: The align window is greater than zero.
+        assert (
+            self.align_window is None or self.align_window > 0
+        ), f"Table has negative or zero align window:\n{repr(self)}"
+        self.fingerprint = hash((Table, self.rows, self.align_window))
 
     def __iter__(self) -> Iterator[Row]:
         return iter(self.rows)
 
+    def windows(self) -> Iterator[Tuple[Row, ...]]:
+        """
+        Split the rows into the windows within which columns are aligned.
+
+        The window size is taken from the table or, if it is not set, from
+        the first row. If neither is set, all rows are aligned together.
+        Each window is rendered only once the output of the window before
+        it has been consumed.
+        """
+        align_window = self.align_window
+        if align_window is None and self.rows:
+            align_window = self.rows[0].info.align_window
+        if align_window is None:
+            yield self.rows
+        else:
+            for start in range(0, len(self.rows), align_window):
+                yield self.rows[start : start + align_window]
+
     @property
     def width_hint(self) -> WidthHint:
         if self.rows:
@@ -836,31 +1139,54 @@ class Table(Doc, Iterable[Row]):
         return {
             "type": "Table",
             "rows": [doc.to_dict() for doc in self.rows],
+            "align_window": self.align_window,
         }
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (_unpickle, (Table, self.rows, self.align_window))
+
     @staticmethod
     def from_dict(kvs: Dict[str, Any]) -> "Table":
         rows = kvs.get("rows", None)
+        align_window = kvs.get("align_window", None)
         if rows is not None:
-            return Table(rows=tuple(Row.from_dict(row) for row in rows))
+            return Table(
+                rows=tuple(Row.from_dict(row) for row in rows),
+                align_window=align_window,
+            )
         raise ValueError(kvs)
 
 
+def _row_info(
+    table_type: Optional[str],
+    hpad: Union[str, Text],
+    hsep: Union[str, Text],
+    min_col_widths: Tuple[Optional[int], ...],
+    align_window: Optional[int],
+) -> RowInfo:
+    # Ensure padding and separators are Text
+    if isinstance(hpad, str):
+        hpad = Text(hpad)
+    if isinstance(hsep, str):
+        hsep = Text(hsep)
+    return RowInfo(
+        table_type=table_type,
+        hpad=hpad,
+        hsep=hsep,
+        min_col_widths=min_col_widths,
+        align_window=align_window,
+    )
+
+
 def row(
     *doclike: DocLike,
     table_type: Optional[str] = None,
     hpad: Union[str, Text] = Space,
     hsep: Union[str, Text] = Space,
     min_col_widths: Tuple[Optional[int], ...] = (),
+    align_window: Optional[int] = None,
 ) -> Doc:
-    # Ensure padding and separators are Text
-    if isinstance(hpad, str):
-        hpad = Text(hpad)
-    if isinstance(hsep, str):
-        hsep = Text(hsep)
-    info = RowInfo(
-        table_type=table_type, hpad=hpad, hsep=hsep, min_col_widths=min_col_widths
-    )
+    info = _row_info(table_type, hpad, hsep, min_col_widths, align_window)
     # Ensure Row settings are preserved
     cells: List[Doc] = []
     for cell_or_row in splat(doclike):
@@ -872,8 +1198,152 @@ def row(
     return Row(tuple(cells), info=info)
 
 
-def table(rows: Iterator[Row]) -> Doc:
-    return Table(tuple(rows))
+def table(rows: Iterator[Row], *, align_window: Optional[int] = None) -> Doc:
+    return Table(tuple(rows), align_window=align_window)
+
+
+@dataclass(eq=False)
+class TextTable(Doc):
+    """
+    A table of plain text cells.
+
+    The cells are kept as strings, and are only converted to tokens when
+    the table is rendered. All rows share the same RowInfo.
+    """
+
+    cells: Tuple[Tuple[str, ...], ...]
+    info: RowInfo
+
+    def __post_init__(self, **rest: Any) -> None:
+        # Invariant: None of cells contains a newline.
+        assert all(
+            len(cell.splitlines()) <= 1 for cells in self.cells for cell in cells
+        ), f"TextTable contains newline:\n{repr(self)}"
+        # Invariant: The hpad text has width 1.
+        assert (
+            len(self.info.hpad.text) == 1
+        ), f"TextTable hpad is not one character:\n'{repr(self)}'"
+        self.fingerprint = hash((TextTable, self.cells, self.info))
+
+    @property
+    def rows(self) -> Tuple[Row, ...]:
+        """
+        Convert the cells to rows of documents.
+        """
+        return tuple(
+            Row(tuple(map(cat, cells)), info=self.info) for cells in self.cells
+        )
+
+    def windows(self) -> Iterator[Tuple[Tuple[str, ...], ...]]:
+        """
+        Split the cells into the windows within which columns are aligned.
+        """
+        align_window = self.info.align_window
+        if align_window is None:
+            yield self.cells
+        else:
+            for start in range(0, len(self.cells), align_window):
+                yield self.cells[start : start + align_window]
+
+    def col_widths(self, cells: Tuple[Tuple[str, ...], ...]) -> Tuple[int, ...]:
+        """
+        Compute the column widths for some of the rows of this table.
+        """
+        min_col_widths = tuple(width or 0 for width in self.info.min_col_widths)
+        return tuple(
+            map(
+                max,
+                zip_longest(
+                    *(map(len, row_cells) for row_cells in cells),
+                    min_col_widths,
+                    fillvalue=0,
+                ),
+            )
+        )
+
+    @staticmethod
+    def tokens(cell: str) -> Iterator[Token]:
+        """
+        Convert a cell to tokens, splitting it into words if necessary.
+        """
+        if Text.RE_ONE_WHITESPACE.search(cell):
+            for token in splat(Text.words(cell), unpack=Cat):
+                yield cast(Token, token)
+        elif cell:
+            yield Text(cell)
+
+    @property
+    def width_hint(self) -> WidthHint:
+        if self.cells:
+            # NOTE: only process the first row
+            width = sum(map(len, self.cells[0]))
+            width += len(self.info.hsep) * max(0, len(self.cells[0]) - 1)
+            # NOTE: rows always end the line
+            return WidthHint(width, True)
+        else:
+            return Unknown
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "TextTable",
+            "cells": [list(cells) for cells in self.cells],
+            "info": self.info.to_dict(),
+        }
+
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return (_unpickle, (TextTable, self.cells, self.info))
+
+    @staticmethod
+    def from_dict(kvs: Dict[str, Any]) -> "TextTable":
+        cells = kvs.get("cells", None)
+        info = kvs.get("info", None)
+        if cells is not None and info is not None:
+            return TextTable(
+                cells=tuple(map(tuple, cells)),
+                info=RowInfo.from_dict(info),
+            )
+        raise ValueError(kvs)
+
+
+def text_table(
+    rows: Iterable[Sequence[str]],
+    *,
+    table_type: Optional[str] = None,
+    hpad: Union[str, Text] = Space,
+    hsep: Union[str, Text] = Space,
+    min_col_widths: Tuple[Optional[int], ...] = (),
+    align_window: Optional[int] = None,
+) -> Doc:
+    """
+    Create a table from rows of strings.
+    """
+    info = _row_info(table_type, hpad, hsep, min_col_widths, align_window)
+    return TextTable(tuple(map(tuple, rows)), info=info)
+
+
+def text_table_from_columns(
+    columns: Iterable[Sequence[str]],
+    *,
+    table_type: Optional[str] = None,
+    hpad: Union[str, Text] = Space,
+    hsep: Union[str, Text] = Space,
+    min_col_widths: Tuple[Optional[int], ...] = (),
+    align_window: Optional[int] = None,
+) -> Doc:
+    """
+    Create a table from columns of strings.
+
+    If the columns have different lengths, the missing cells at the end of
+    a row are omitted, and any other missing cells are empty.
+    """
+    info = _row_info(table_type, hpad, hsep, min_col_widths, align_window)
+    rows: List[Tuple[str, ...]] = []
+    for row_cells in zip_longest(*columns):
+        n_cells = len(row_cells)
+        while n_cells > 0 and row_cells[n_cells - 1] is None:
+            n_cells -= 1
+        rows.append(tuple(cell or "" for cell in row_cells[:n_cells]))
+    return TextTable(tuple(rows), info=info)
 
 
 @dataclass
@@ -0,0 +1,89 @@
+import dataclasses
+from dataclasses import dataclass, field
+from typing import List
+
+from .abc import *
+from .buffer import TokenBuffer
+from .doc import *
+from .smart import *
+
+
+@dataclass
+class RenderUpdate:
+    """
+    The result of re-rendering a document with an IncrementalDocRenderer.
+
+    The lines are the indices of the lines in the new output that were
+    re-rendered, and the old_lines are the indices of the lines in the
+    previous output that they replace.
+    """
+
+    text: str
+    lines: range
+    old_lines: range
+
+
+def _count_lines(token_buffer: TokenBuffer) -> int:
+    n_lines: int = 0
+    for token in token_buffer:
+        if token is Line:
+            n_lines += 1
+    if token_buffer and token_buffer[-1] is not Line:
+        n_lines += 1
+    return n_lines
+
+
+@dataclass
+class IncrementalDocRenderer(DocRenderer):
+    """
+    Render successive versions of a document, re-rendering only the
+    top-level segments that changed since the previous version.
+    """
+
+    doc_renderer: SimpleDocRenderer = field(default_factory=SmartDocRenderer)
+    docs: List[Doc] = field(default_factory=list, init=False, repr=False)
+    token_buffers: List[TokenBuffer] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def render(self, doc: Doc) -> TokenStream:
+        self.update(doc)
+        for token_buffer in self.token_buffers:
+            yield from token_buffer
+
+    def update(self, doc: Doc) -> RenderUpdate:
+        old_docs = self.docs
+        new_docs = list(segments(doc))
+        # Find the unchanged segments at the start and end of the document
+        prefix: int = 0
+        max_prefix = min(len(old_docs), len(new_docs))
+        while prefix < max_prefix and old_docs[prefix] == new_docs[prefix]:
+            prefix += 1
+        suffix: int = 0
+        max_suffix = max_prefix - prefix
+        while suffix < max_suffix and old_docs[-1 - suffix] == new_docs[-1 - suffix]:
+            suffix += 1
+        # Render the changed segments
+        old_token_buffers = self.token_buffers[prefix : len(old_docs) - suffix]
+        new_token_buffers = [
+            self.render_segment(new_doc)
+            for new_doc in new_docs[prefix : len(new_docs) - suffix]
+        ]
+        self.docs = new_docs
+        self.token_buffers[prefix : len(old_docs) - suffix] = new_token_buffers
+        # Compute the changed line ranges
+        start = sum(map(_count_lines, self.token_buffers[:prefix]))
+        return RenderUpdate(
+            text="".join(
+                token.text
+                for token_buffer in self.token_buffers
+                for token in token_buffer
+            ),
+            lines=range(start, start + sum(map(_count_lines, new_token_buffers))),
+            old_lines=range(start, start + sum(map(_count_lines, old_token_buffers))),
+        )
+
+    def render_segment(self, doc: Doc) -> TokenBuffer:
+        # NOTE: Each segment is rendered by a fresh renderer, which starts at
+        #       the first column, with the same configuration.
+        return list(dataclasses.replace(self.doc_renderer).render(doc))
@@ -0,0 +1,172 @@
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from ._compat_itertools import repeat
+from .abc import *
+from .doc import *
+from .smart import *
+
+
+def _render_texts(doc_renderer: DocRenderer, doc: Doc) -> List[str]:
+    return [token.text for token in doc_renderer.render(doc)]
+
+
+@dataclass
+class ParallelDocRenderer(DocRenderer):
+    """
+    Render the top-level segments of a document in worker processes.
+
+    The output is identical to the output of the wrapped renderer, because
+    each segment starts at column zero.
+
+    The segments are rendered using the executor or, if it is not set, a
+    process pool that is created when it is first needed, and shut down by
+    close. The renderer may be shared by threads.
+    """
+
+    doc_renderer: DocRenderer = field(default_factory=SmartDocRenderer)
+    max_workers: Optional[int] = None
+    chunks_per_worker: int = 4
+    executor: Optional[Executor] = None
+    process_pool: Optional[ProcessPoolExecutor] = field(
+        default=None, init=False, repr=False
+    )
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def render(self, doc: Doc) -> TokenStream:
+        yield from map(Text, self.render_texts(doc))
+
+    def to_str(self, doc: Doc) -> str:
+        return "".join(self.render_texts(doc))
+
+    def render_texts(self, doc: Doc) -> Iterator[str]:
+        chunks = list(self.chunks(doc))
+        if self.n_workers <= 1 or len(chunks) <= 1:
+            yield from (token.text for token in self.doc_renderer.render(doc))
+        else:
+            executor = self.get_executor()
+            for texts in executor.map(_render_texts, repeat(self.doc_renderer), chunks):
+                yield from texts
+
+    def get_executor(self) -> Executor:
+        """
+        Return the executor or, if it is not set, the process pool.
+        """
+        if self.executor is not None:
+            return self.executor
+        with self.lock:
+            if self.process_pool is None:
+                self.process_pool = ProcessPoolExecutor(max_workers=self.n_workers)
+            return self.process_pool
+
+    def close(self) -> None:
+        with self.lock:
+            if self.process_pool is not None:
+                self.process_pool.shutdown()
+                self.process_pool = None
+
+    @property
+    def n_workers(self) -> int:
+        return self.max_workers or os.cpu_count() or 1
+
+    def chunks(self, doc: Doc) -> Iterator[Doc]:
+        """
+        Group the segments of a document into chunks of roughly equal length.
+        """
+        docs = list(segments(doc))
+        n_chunks = min(len(docs), self.n_workers * self.chunks_per_worker)
+        if n_chunks > 0:
+            size, extra = divmod(len(docs), n_chunks)
+            start: int = 0
+            for i in range(0, n_chunks):
+                end = start + size + (1 if i < extra else 0)
+                yield cat(docs[start:end])
+                start = end
+
+
+def _render_alt_texts(
+    doc_renderer: SmartDocRenderer, column: int, strict: bool, doc: Doc
+) -> Optional[List[str]]:
+    doc_renderer.column = column
+    try:
+        if strict:
+            with doc_renderer.strict():
+                return _render_texts(doc_renderer, doc)
+        else:
+            return _render_texts(doc_renderer, doc)
+    except LineWidthExceeded:
+        return None
+
+
+def _is_large(doc: Doc, min_size: int) -> bool:
+    size: int = 0
+    stack: List[Doc] = [doc]
+    while stack:
+        doc = stack.pop()
+        size += 1
+        if size >= min_size:
+            return True
+        if isinstance(doc, (Cat, Alt, Fill, Row, Table)):
+            stack.extend(doc)
+        elif isinstance(doc, (Group, Nest, Edit)):
+            stack.append(doc.doc)
+    return False
+
+
+@dataclass
+class SpeculativeDocRenderer(SmartDocRenderer):
+    """
+    Render the alternatives of large Alts speculatively using an executor.
+
+    All alternatives are submitted at once, and the widest alternative that
+    fits is used. Alts with fewer than min_alt_size nodes, or inside a flat
+    Group, are rendered as by SmartDocRenderer. The on_emit callbacks are
+    not run in the workers.
+    """
+
+    executor: Optional[Executor] = None
+    min_alt_size: int = 1000
+
+    def alternatives(self, doc: Alt) -> Tuple[Iterable[Doc], Optional[Doc]]:
+        state = self.state
+        # NOTE: The workers render the alternatives as they are, so inside a
+        #       flat Group, whose Lines are removed, the Alt is rendered here.
+        if (
+            self.executor is None
+            or state.flat
+            or (state.deadline is not None and state.degraded)
+            or not _is_large(doc, self.min_alt_size)
+        ):
+            return super().alternatives(doc)
+        fallback, *alts = doc.alts
+        fallback_future = self.submit_alt(fallback, strict=self.is_strict)
+        alt_futures = [
+            self.submit_alt(alt, strict=True)
+            for alt in alts
+            if not (
+                isinstance(alt, (Table, TextTable)) and self.table_fits(alt) is False
+            )
+        ]
+        for alt_future in reversed(alt_futures):
+            texts = alt_future.result()
+            if texts is not None:
+                fallback_future.cancel()
+                break
+        else:
+            texts = fallback_future.result()
+            if texts is None:
+                raise LineWidthExceeded()
+        # NOTE: The rendered alternative is rendered again as its tokens.
+        return ((), cat(map(Text, texts)))
+
+    def submit_alt(self, alt: Doc, *, strict: bool) -> "Future[Optional[List[str]]]":
+        assert self.executor is not None
+        doc_renderer = SmartDocRenderer(
+            simple_layout=self.simple_layout, max_line_width=self.max_line_width
+        )
+        return self.executor.submit(
+            _render_alt_texts, doc_renderer, self.column, strict, alt
+        )
@@ -1,13 +1,27 @@
 import enum
-from contextlib import contextmanager
+import math
+import threading
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass, field
-from typing import Iterator, List, Optional, Tuple
+from typing import (
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
-from ._compat_itertools import repeat
+from ._compat_itertools import chain, repeat
 from ._compat_singledispatchmethod import singledispatchmethod
 from .abc import *
+from .buffer import *
 from .doc import *
-from .table import *
+from .stats import *
 
 
 class SimpleLayout(enum.IntEnum):
@@ -15,12 +29,560 @@ class SimpleLayout(enum.IntEnum):
     LongestLines = -1  # Always pick the last alternative
 
 
+@dataclass
+class _Trace:
+    """
+    The end of a traced document, and the time at which it was started.
+    """
+
+    node_stats: NodeStats
+    start: float
+    paused: float
+
+    def stop(self, paused: float) -> None:
+        # NOTE: The time that the renderer was paused, while the consumer
+        #       processed its tokens, is not counted.
+        elapsed = time.perf_counter() - self.start
+        self.node_stats.seconds += elapsed - (paused - self.paused)
+
+
+@dataclass
+class _Buffered:
+    """
+    The end of a Nest or Edit, whose tokens are buffered.
+    """
+
+    doc: Union[Nest, Edit]
+
+
+@dataclass
+class _Flat:
+    """
+    The flat layout of a Group or, if doc is None, its end.
+    """
+
+    doc: Optional[Doc]
+
+
+_END_FLAT = _Flat(None)
+
+
+@dataclass
+class _Gap:
+    """
+    The separator between two documents of a Fill.
+    """
+
+
+_GAP = _Gap()
+
+
+_Layout = Tuple[Union[Alt, Group], int, TokenBuffer]
+
+
+@dataclass
+class _Trial:
+    """
+    The end of an alternative that is tried in strict mode, and the
+    alternatives that remain to be tried if it does not fit.
+
+    The number of narrowed Alts when the trial started is kept, so that if
+    it is unchanged once the trial succeeds, the last alternative of every
+    Alt in the trial was used. The layouts of such Alts inside the trial are
+    only remembered if the trial itself is not.
+    """
+
+    doc: Union[Alt, Group]
+    candidates: Iterator[Doc]
+    fallback: Optional[Doc]
+    exit_stack: ExitStack
+    stack_size: int = 0
+    buffer_count: int = 0
+    narrowed_alts: int = 0
+    flat: int = 0
+    layouts: List[_Layout] = field(default_factory=list)
+
+
+_Frame = Union[Doc, _Trace, _Buffered, _Flat, _Gap, _Trial]
+
+
+@dataclass
+class RenderState:
+    """
+    The state of a renderer while it renders a document.
+
+    Each render has its own render state, so that one renderer, and any
+    caches it holds, can be shared by renders that are interleaved, e.g.,
+    by threads or by coroutines.
+    """
+
+    line: int = 0
+    column: int = 0
+    position_stack: List[Tuple[int, int]] = field(default_factory=list)
+    is_strict: bool = False
+    # NOTE: The batch callbacks installed while rendering, e.g., by strict,
+    #       which are invoked after the batch callbacks of the renderer.
+    on_emit_batch: List[OnEmitBatch] = field(default_factory=list)
+    # NOTE: The number of Alts for which an alternative other than the last
+    #       was tried first, or which fell back to another alternative.
+    narrowed_alts: int = 0
+    # NOTE: The number of steps after which a render that is not started by
+    #       another render yields Pause, or zero if it does not pause.
+    pause_frames: int = 0
+    # NOTE: The number of Groups that are laid out flat. While it is positive,
+    #       Lines are not emitted.
+    flat: int = 0
+    # NOTE: The budget of the render in progress, as the time at which it
+    #       runs out and the number of alternatives that may still be tried,
+    #       or None if it has no budget.
+    deadline: Optional[float] = None
+    alternatives_left: float = math.inf
+    # NOTE: Whether the render ran out of its budget.
+    degraded: bool = False
+
+
+class _RunningRenderStates(threading.local):
+    def __init__(self) -> None:
+        self.states: Dict[int, Optional[RenderState]] = {}
+
+
+# NOTE: The state of the render that is running in this thread, by the id of
+#       its renderer. A render only sets its state while its code runs, and
+#       restores the state that was set before, or None, while it is
+#       suspended, and once it is finished.
+_RUNNING = _RunningRenderStates()
+
+
+# NOTE: The number of tokens up to which a render emits the Texts that follow
+#       the tokens it yields, before it is suspended.
+_TEXT_RUN_SIZE = 16
+
+
 @dataclass
 class SimpleDocRenderer(DocRenderer):
     simple_layout: SimpleLayout = SimpleLayout.ShortestLines
 
     def render(self, doc: Doc) -> TokenStream:
-        yield from self.render_simple(doc)
+        """
+        Render a document as a stream of tokens.
+
+        A render that is started outside of any other render has its own
+        render state, created by new_render_state, and a render that is
+        started while another render runs shares its state.
+        """
+        state = _RUNNING.states.get(id(self), None)
+        if state is None:
+            state = self.new_render_state()
+        return self.render_with_state(doc, state)
+
+    def new_render_state(self) -> RenderState:
+        """
+        Create the state of a render, which starts at the position, and in
+        the mode, that are set on the renderer outside of any render.
+        """
+        idle = self.idle_state
+        if idle is None:
+            return RenderState()
+        return RenderState(
+            line=idle.line,
+            column=idle.column,
+            is_strict=idle.is_strict,
+            on_emit_batch=list(idle.on_emit_batch),
+        )
+
+    def render_pausing(self, doc: Doc, pause_frames: int) -> TokenStream:
+        if _RUNNING.states.get(id(self), None) is not None:
+            return self.render(doc)
+        state = self.new_render_state()
+        state.pause_frames = pause_frames
+        return self.render_with_state(doc, state)
+
+    def render_with_state(self, doc: Doc, state: RenderState) -> TokenStream:
+        """
+        Render a document as a stream of tokens, using the given render state.
+
+        The document is walked using an explicit stack, rather than by
+        recursion, so the cost of emitting a token does not depend on how
+        deeply it is nested, and deep documents do not exceed the recursion
+        limit. Texts, Cats, Alts, Groups, Fills, Nests, and Edits are handled
+        here, and all other documents by render_node.
+        """
+        stats = self.stats
+        key = id(self)
+        outer_state = _RUNNING.states.get(key, None)
+        _RUNNING.states[key] = state
+        flat_base = state.flat
+        position_stack = state.position_stack
+        position_base = len(position_stack)
+        stack: List[_Frame] = [doc]
+        # NOTE: The tokens of the innermost Nest, Edit, or alternative that is
+        #       being rendered are collected in the last buffer, and the tokens
+        #       outside of any buffer are yielded.
+        buffers: List[TokenBuffer] = []
+        trials: List[_Trial] = []
+        text_run: TokenBuffer = []
+        paused: float = 0.0
+        pause_frames = state.pause_frames if outer_state is not state else 0
+        frames_left = pause_frames
+        try:
+            while stack:
+                if pause_frames:
+                    frames_left -= 1
+                    if not frames_left:
+                        # NOTE: The render pauses even while it is buffering,
+                        #       e.g., inside a Nest or an alternative.
+                        frames_left = pause_frames
+                        _RUNNING.states[key] = outer_state
+                        pause = time.perf_counter()
+                        yield Pause
+                        paused += time.perf_counter() - pause
+                        _RUNNING.states[key] = state
+                frame = stack.pop()
+                frame_type = type(frame)
+                tokens: Iterable[Token]
+                try:
+                    if stats is not None and isinstance(frame, Doc):
+                        node_stats = stats.visit(frame)
+                        stack.append(_Trace(node_stats, time.perf_counter(), paused))
+                    if frame_type is Text:
+                        if frame is Line and state.flat:
+                            continue
+                        tokens = (self.emit(cast(Text, frame), state),)
+                    elif frame_type is Cat:
+                        stack.extend(reversed(cast(Cat, frame).docs))
+                        continue
+                    elif frame_type is Alt or frame_type is Group:
+                        alt_doc = cast(Union[Alt, Group], frame)
+                        if frame_type is Group and state.flat:
+                            # NOTE: Inside a flat Group, every Group is flat.
+                            stack.append(cast(Group, frame).doc)
+                            continue
+                        # NOTE: The layouts inside a flat Group lack their
+                        #       Lines, so they are not remembered or reused.
+                        layout = None
+                        if not state.flat:
+                            layout = self.remembered_layout(alt_doc)
+                        if layout is None:
+                            trial = _Trial(
+                                alt_doc,
+                                iter(()),
+                                None,
+                                ExitStack(),
+                                narrowed_alts=state.narrowed_alts,
+                                flat=state.flat,
+                            )
+                            candidate: Optional[_Frame]
+                            if frame_type is Alt:
+                                alts = cast(Alt, frame).alts
+                                candidates, trial.fallback = self.alternatives(
+                                    cast(Alt, frame)
+                                )
+                                trial.candidates = iter(candidates)
+                                candidate = next(trial.candidates, None)
+                                if len(alts) > 1 and candidate is not alts[-1]:
+                                    state.narrowed_alts += 1
+                            else:
+                                trial.fallback = cast(Group, frame).doc
+                                if self.try_flat(cast(Group, frame)):
+                                    candidate = _Flat(trial.fallback)
+                                else:
+                                    candidate = None
+                                    state.narrowed_alts += 1
+                            if candidate is None:
+                                if trial.fallback is not None:
+                                    stack.append(trial.fallback)
+                                continue
+                            # Try the first alternative in strict mode
+                            trial.exit_stack.enter_context(self.strict())
+                            position_stack.append((state.line, state.column))
+                            buffers.append([])
+                            stack.append(trial)
+                            trial.stack_size = len(stack)
+                            trial.buffer_count = len(buffers)
+                            trials.append(trial)
+                            if stats is not None:
+                                stats.alternatives_tried += 1
+                            stack.append(candidate)
+                            continue
+                        tokens = self.emit_many(layout, state)
+                    elif frame_type is Fill:
+                        fill_docs = cast(Fill, frame).docs
+                        # NOTE: A Fill of words is filled in a single pass,
+                        #       unless its words are traced or edited as
+                        #       they are emitted.
+                        if (
+                            stats is None
+                            and not self.on_emit
+                            and all(type(fill_doc) is Text for fill_doc in fill_docs)
+                        ):
+                            tokens = self.emit_many(
+                                self.fill_words(cast(Tuple[Text, ...], fill_docs)),
+                                state,
+                            )
+                        else:
+                            stack.append(fill_docs[-1])
+                            for fill_doc in reversed(fill_docs[:-1]):
+                                stack.append(_GAP)
+                                stack.append(fill_doc)
+                            continue
+                    elif frame_type is Nest or frame_type is Edit:
+                        position_stack.append((state.line, state.column))
+                        buffers.append([])
+                        stack.append(_Buffered(cast(Union[Nest, Edit], frame)))
+                        stack.append(cast(Union[Nest, Edit], frame).doc)
+                        continue
+                    elif frame_type is _Flat:
+                        flat_doc = cast(_Flat, frame).doc
+                        if flat_doc is None:
+                            state.flat -= 1
+                        else:
+                            state.flat += 1
+                            stack.append(_END_FLAT)
+                            stack.append(flat_doc)
+                        continue
+                    elif frame_type is _Gap:
+                        separator = self.fill_separator(state.column)
+                        if separator is Line and state.flat:
+                            continue
+                        tokens = (self.emit(separator, state),)
+                    elif frame_type is _Buffered:
+                        buffered = cast(_Buffered, frame).doc
+                        token_buffer = buffers.pop()
+                        state.line, state.column = position_stack.pop()
+                        if isinstance(buffered, Nest):
+                            if stats is not None:
+                                stats.buffered(len(token_buffer))
+                            token_buffer = self.indent(buffered, token_buffer)
+                        else:
+                            token_buffer = list(buffered.function(iter(token_buffer)))
+                            if stats is not None:
+                                stats.buffered(len(token_buffer))
+                        tokens = self.emit_many(token_buffer, state)
+                    elif frame_type is _Trial:
+                        trial = trials.pop()
+                        token_buffer = buffers.pop()
+                        state.line, state.column = position_stack.pop()
+                        if stats is not None:
+                            stats.buffered(len(token_buffer))
+                        if trial.flat:
+                            pass
+                        elif trial.narrowed_alts != state.narrowed_alts:
+                            self.remember_layouts(trial.layouts)
+                        elif trials and trials[-1].narrowed_alts == state.narrowed_alts:
+                            trials[-1].layouts.append(
+                                (trial.doc, state.column, token_buffer)
+                            )
+                        else:
+                            self.remember_layouts(
+                                [(trial.doc, state.column, token_buffer)]
+                            )
+                        tokens = self.emit_many(token_buffer, state)
+                        cast(_Trial, frame).exit_stack.close()
+                    elif frame_type is _Trace:
+                        cast(_Trace, frame).stop(paused)
+                        continue
+                    else:
+                        tokens = self.render_node(cast(Doc, frame))
+                    if buffers:
+                        buffers[-1].extend(tokens)
+                        continue
+                    if outer_state is not state:
+                        # NOTE: The tokens are produced while this render runs,
+                        #       and the outer state is restored while it is
+                        #       suspended, so that other renders can run.
+                        if type(tokens) is not list and type(tokens) is not tuple:
+                            # NOTE: The output of render_node is produced as
+                            #       it is consumed, e.g., a Table one window
+                            #       at a time, so it is pulled one line at a
+                            #       time, and the state is swapped per line.
+                            token_iter = iter(tokens)
+                            for token in token_iter:
+                                text_run.clear()
+                                text_run.append(token)
+                                error: Optional[LineWidthExceeded] = None
+                                try:
+                                    while (
+                                        token is not Line
+                                        and len(text_run) < _TEXT_RUN_SIZE
+                                    ):
+                                        token = next(token_iter)
+                                        text_run.append(token)
+                                except StopIteration:
+                                    pass
+                                except LineWidthExceeded as exc:
+                                    # NOTE: The tokens before it are yielded.
+                                    error = exc
+                                _RUNNING.states[key] = outer_state
+                                if stats is None:
+                                    yield from text_run
+                                else:
+                                    for token in text_run:
+                                        pause = time.perf_counter()
+                                        yield token
+                                        paused += time.perf_counter() - pause
+                                _RUNNING.states[key] = state
+                                if error is not None:
+                                    raise error
+                            continue
+                        # NOTE: The Texts that follow are emitted along with
+                        #       the tokens, so that the state is swapped once
+                        #       per run.
+                        if (
+                            stats is None
+                            and stack
+                            and type(stack[-1]) is Text
+                            and len(tokens) < _TEXT_RUN_SIZE
+                        ):
+                            text_run.clear()
+                            text_run.extend(tokens)
+                            while (
+                                stack
+                                and type(stack[-1]) is Text
+                                and len(text_run) < _TEXT_RUN_SIZE
+                            ):
+                                text = cast(Text, stack.pop())
+                                if text is Line and state.flat:
+                                    continue
+                                try:
+                                    text_run.append(self.emit(text, state))
+                                except LineWidthExceeded:
+                                    # NOTE: The Text is emitted again after the
+                                    #       tokens before it are yielded.
+                                    stack.append(text)
+                                    break
+                            tokens = text_run
+                        _RUNNING.states[key] = outer_state
+                    if stats is None:
+                        yield from tokens
+                    else:
+                        for token in tokens:
+                            pause = time.perf_counter()
+                            yield token
+                            paused += time.perf_counter() - pause
+                    _RUNNING.states[key] = state
+                except LineWidthExceeded:
+                    if not trials:
+                        raise
+                    # Discard the alternative, and try the next alternative
+                    trial = trials[-1]
+                    state.narrowed_alts += 1
+                    if stats is not None:
+                        stats.alternatives_failed += 1
+                        for discarded in stack[trial.stack_size :]:
+                            if isinstance(discarded, _Trace):
+                                discarded.stop(paused)
+                    del stack[trial.stack_size :]
+                    del buffers[trial.buffer_count :]
+                    buffers[-1].clear()
+                    position_count = position_base + trial.buffer_count
+                    state.line, state.column = position_stack[position_count - 1]
+                    del position_stack[position_count:]
+                    state.flat = trial.flat
+                    candidate = next(trial.candidates, None)
+                    if candidate is not None:
+                        if stats is not None:
+                            stats.alternatives_tried += 1
+                        stack.append(candidate)
+                    else:
+                        trials.pop()
+                        buffers.pop()
+                        position_stack.pop()
+                        trial.exit_stack.close()
+                        stack.pop()
+                        self.remember_layouts(trial.layouts)
+                        if trial.fallback is not None:
+                            stack.append(trial.fallback)
+        finally:
+            # NOTE: If rendering is interrupted, by an exception or because the
+            #       consumer stopped, the position before the first unfinished
+            #       buffer is restored, as if each buffer had been discarded.
+            _RUNNING.states[key] = state
+            for trial in reversed(trials):
+                trial.exit_stack.close()
+            state.flat = flat_base
+            if len(position_stack) > position_base:
+                state.line, state.column = position_stack[position_base]
+                del position_stack[position_base:]
+            if outer_state is None:
+                del _RUNNING.states[key]
+            else:
+                _RUNNING.states[key] = outer_state
+            # NOTE: The idle state is not created only to record that the
+            #       render did not degrade.
+            if outer_state is not state and (
+                state.degraded or outer_state is not None or self.idle_state is not None
+            ):
+                self.state.degraded = state.degraded
+
+    def render_node(self, doc: Doc) -> TokenStream:
+        """
+        Render a document that is not handled by render itself.
+        """
+        return self.render_simple(doc)
+
+    def alternatives(self, doc: Alt) -> Tuple[Iterable[Doc], Optional[Doc]]:
+        """
+        Return the alternatives of an Alt that are tried in strict mode, in
+        order, and the alternative that is rendered if none of them fit.
+        """
+        if doc.alts:
+            return ((), doc.alts[int(self.simple_layout)])
+        else:
+            return ((), None)
+
+    def try_flat(self, doc: Group) -> bool:
+        """
+        Return whether the flat layout of a Group is tried in strict mode,
+        before its broken layout.
+        """
+        return self.simple_layout is SimpleLayout.LongestLines
+
+    def fill_separator(self, column: int) -> Token:
+        """
+        Return the separator between two documents of a Fill, the first of
+        which ends at the given column, which is Line or Space, chosen as for
+        SoftLine.
+        """
+        return (Line, Space)[int(self.simple_layout)]
+
+    def fill_words(self, words: Tuple[Text, ...]) -> TokenBuffer:
+        """
+        Return the tokens of a Fill of words, with the separators chosen in a
+        single pass over the widths of the words.
+        """
+        column = self.column
+        token_buffer: TokenBuffer = []
+        for word in words:
+            if token_buffer:
+                separator = self.fill_separator(column)
+                token_buffer.append(separator)
+                column = 0 if separator is Line else column + len(separator)
+            token_buffer.append(word)
+            column = 0 if word is Line else column + len(word.text)
+        return token_buffer
+
+    def remember_layouts(self, layouts: Iterable[_Layout]) -> None:
+        """
+        Called with Alts whose last alternative fits, starting at some column,
+        and so does the last alternative of every Alt inside of them, and the
+        tokens of those alternatives. The last alternative of a Group is its
+        flat layout.
+        """
+
+    def remembered_layout(self, doc: Union[Alt, Group]) -> Optional[TokenBuffer]:
+        """
+        Return the tokens of a remembered layout of an Alt at the current
+        column, if any, which are emitted instead of trying its alternatives.
+        """
+        return None
+
+    def strict(self) -> ContextManager[None]:
+        """
+        Enter strict mode, in which emitting a token that exceeds the maximum
+        line width raises LineWidthExceeded. The simple renderer has no
+        maximum line width.
+        """
+        return nullcontext()
 
     @singledispatchmethod
     def render_simple(self, doc: Doc) -> TokenStream:
@@ -39,97 +601,231 @@ class SimpleDocRenderer(DocRenderer):
 
     @render_simple.register
     def _(self, doc: Cat) -> TokenStream:
-        yield from self.render_stream(doc.docs)
+        yield from self.render(doc)
+
+    @render_simple.register
+    def _(self, doc: Group) -> TokenStream:
+        yield from self.render(doc)
+
+    @render_simple.register
+    def _(self, doc: Fill) -> TokenStream:
+        yield from self.render(doc)
 
     @render_simple.register
     def _(self, doc: Row) -> TokenStream:
         row_buffer = self.buffer_row(doc)
-        yield from map(self.emit, row_buffer.render())
-        yield self.emit(Line)
+        yield from self.emit_many(chain(row_buffer.render(), (Line,)))
 
     @render_simple.register
     def _(self, doc: Table) -> TokenStream:
-        table_buffer = self.buffer_table(doc)
-        yield from map(self.emit, table_buffer.render())
+        # NOTE: Each window is emitted as soon as it has been buffered.
+        for rows in doc.windows():
+            table_buffer = self.buffer_rows(rows)
+            yield from self.emit_many(table_buffer.render())
+
+    @render_simple.register
+    def _(self, doc: TextTable) -> TokenStream:
+        # NOTE: The cells are plain text, so their widths are known without
+        #       rendering them, and the rows are emitted without buffering.
+        hpad, hsep = doc.info.hpad, doc.info.hsep
+        for cells in doc.windows():
+            col_widths = doc.col_widths(cells)
+            for row_cells in cells:
+                token_buffer: TokenBuffer = []
+                last = len(row_cells) - 1
+                for j, cell in enumerate(row_cells):
+                    token_buffer.extend(doc.tokens(cell))
+                    if j < last:
+                        token_buffer.extend(repeat(hpad, col_widths[j] - len(cell)))
+                        token_buffer.append(hsep)
+                token_buffer.append(Line)
+                yield from self.emit_many(token_buffer)
 
     @render_simple.register
     def _(self, doc: Nest) -> TokenStream:
+        yield from self.render(doc)
+
+    @render_simple.register
+    def _(self, doc: Edit) -> TokenStream:
+        yield from self.render(doc)
+
+    def indent(self, doc: Nest, token_buffer: TokenBuffer) -> TokenBuffer:
+        """
+        Indent the buffered tokens of the body of a Nest, which is rendered
+        at the current column.
+        """
         first_line: bool = True
         has_content: bool = False
         line_indent: int = 0
-        buffer = self.buffer_stream(self.render(doc.doc))
-        for token in buffer:
+        # NOTE: Nothing is emitted before the first content on the first line,
+        #       so the starting column is the column of that content.
+        column = self.column
+        indented: TokenBuffer = []
+        for token in token_buffer:
             if token is Line:
                 first_line = False
                 has_content = False
                 line_indent = 0
-                yield self.emit(Line)
+                indented.append(Line)
             else:
                 if has_content:
-                    yield self.emit(token)
+                    indented.append(token)
                 else:
                     if token is Space:
                         line_indent += 1
                     else:
                         has_content = True
                         if first_line:
-                            # TODO: what if doc.indent < self.column?
-                            if doc.overlap and doc.indent > self.column:
-                                yield from self.padding(
-                                    line_indent + doc.indent - self.column
+                            # TODO: what if doc.indent < column?
+                            if doc.overlap and doc.indent > column:
+                                indented.extend(
+                                    repeat(Space, line_indent + doc.indent - column)
                                 )
                         else:
-                            yield from self.padding(line_indent + doc.indent)
-                        yield self.emit(token)
-
-    @render_simple.register
-    def _(self, doc: Edit) -> TokenStream:
-        buffer = self.buffer_stream(doc.function(self.render(doc.doc)))
-        yield from map(self.emit, buffer)
+                            indented.extend(repeat(Space, line_indent + doc.indent))
+                        indented.append(token)
+        return indented
 
     ###########################################################################
     # Padding
     ###########################################################################
 
     def padding(self, amount: int) -> TokenStream:
-        yield from map(self.emit, repeat(Space, amount))
+        yield from self.emit_many(repeat(Space, amount))
 
     ###########################################################################
     # Emitting Tokens & Tracking Position
     ###########################################################################
 
     on_emit: List[OnEmit] = field(default_factory=list)
+    on_emit_batch: List[OnEmitBatch] = field(default_factory=list)
+
+    stats: Optional[RenderStats] = None
+
+    # NOTE: The state from which renders start, which is only created once
+    #       it is used outside of any render.
+    idle_state: Optional[RenderState] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def state(self) -> RenderState:
+        """
+        The state of the render that is running in the current thread or,
+        outside of any render, the state from which renders start.
+        """
+        state = _RUNNING.states.get(id(self), None)
+        if state is None:
+            state = self.idle_state
+            if state is None:
+                state = self.idle_state = RenderState()
+        return state
+
+    @property
+    def degraded(self) -> bool:
+        """
+        Whether the last render that finished ran out of its budget, and chose
+        the first alternative of the Alts after that. To tell for a render
+        that runs concurrently with others, pass its own state to
+        render_with_state.
+        """
+        return self.state.degraded
+
+    @property
+    def line(self) -> int:
+        return self.state.line
 
-    line: int = field(default=0, init=False)
-    column: int = field(default=0, init=False)
+    @line.setter
+    def line(self, line: int) -> None:
+        self.state.line = line
 
-    def emit(self, token: Token) -> Token:
+    @property
+    def column(self) -> int:
+        return self.state.column
+
+    @column.setter
+    def column(self, column: int) -> None:
+        self.state.column = column
+
+    def emit(self, token: Token, state: Optional[RenderState] = None) -> Token:
+        """
+        Emit a token, and update the position of the given render state, which
+        is that of the running render by default.
+        """
+        if state is None:
+            state = self.state
+        if self.stats is not None:
+            self.stats.tokens_emitted += 1
         # Invoke all callbacks
         for cb in self.on_emit:
             token = cb(token)
+        for batch_cb in self.on_emit_batch:
+            batch_cb((token,), state.line, state.column)
+        for batch_cb in state.on_emit_batch:
+            batch_cb((token,), state.line, state.column)
         # Update position
         if token is Line:
-            self.line += 1
-            self.column = 0
+            state.line += 1
+            state.column = 0
         else:
-            self.column += len(token)
+            state.column += len(token)
         return token
 
+    def emit_many(
+        self, tokens: Iterable[Token], state: Optional[RenderState] = None
+    ) -> TokenBuffer:
+        """
+        Emit a run of tokens, and update the position of the given render
+        state, which is that of the running render by default.
+
+        The batch callbacks are invoked once for the whole run, with the line
+        and column of its first token. If there are any per-token callbacks,
+        the tokens are emitted one by one, since those callbacks may depend on
+        the position of each token.
+        """
+        if state is None:
+            state = self.state
+        if state.flat:
+            # NOTE: Inside a flat Group, Lines are not emitted.
+            tokens = [token for token in tokens if token is not Line]
+        if self.on_emit:
+            return [self.emit(token, state) for token in tokens]
+        token_buffer = tokens if isinstance(tokens, list) else list(tokens)
+        if self.stats is not None:
+            self.stats.tokens_emitted += len(token_buffer)
+        line, column = state.line, state.column
+        # Invoke all callbacks
+        for batch_cb in self.on_emit_batch:
+            batch_cb(token_buffer, line, column)
+        for batch_cb in state.on_emit_batch:
+            batch_cb(token_buffer, line, column)
+        # Update position
+        for token in token_buffer:
+            if token is Line:
+                line += 1
+                column = 0
+            else:
+                column += len(token.text)
+        state.line = line
+        state.column = column
+        return token_buffer
+
     ###########################################################################
     # Buffering
     ###########################################################################
 
-    position_stack: List[Tuple[int, int]] = field(default_factory=list, init=False)
+    @property
+    def position_stack(self) -> List[Tuple[int, int]]:
+        return self.state.position_stack
 
     @contextmanager
     def buffering(self) -> Iterator[None]:
-        self.position_stack.append((self.line, self.column))
+        state = self.state
+        state.position_stack.append((state.line, state.column))
         try:
             yield None
         finally:
-            line, column = self.position_stack.pop()
-            self.line = line
-            self.column = column
+            state.line, state.column = state.position_stack.pop()
 
     @property
     def is_buffering(self) -> bool:
@@ -146,6 +842,8 @@ class SimpleDocRenderer(DocRenderer):
                 if token is Line:
                     succeeded = True
                     break
+        if self.stats is not None:
+            self.stats.buffered(len(token_buffer))
         if succeeded:
             return (token_buffer, token_stream)
         else:
@@ -155,6 +853,8 @@ class SimpleDocRenderer(DocRenderer):
     def buffer_stream(self, token_stream: TokenStream) -> TokenBuffer:
         with self.buffering():
             token_buffer = list(token_stream)
+        if self.stats is not None:
+            self.stats.buffered(len(token_buffer))
         return token_buffer
 
     def buffer_row(self, row: Row) -> RowBuffer:
@@ -167,7 +867,10 @@ class SimpleDocRenderer(DocRenderer):
         return row_buffer
 
     def buffer_table(self, table: Table) -> TableBuffer:
+        return self.buffer_rows(table.rows)
+
+    def buffer_rows(self, rows: Iterable[Row]) -> TableBuffer:
         table_buffer = TableBuffer()
-        table_buffer.extend(self.buffer_row(row) for row in table.rows)
+        table_buffer.extend(self.buffer_row(row) for row in rows)
         table_buffer.update()
         return table_buffer
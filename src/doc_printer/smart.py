@@ -1,42 +1,220 @@
+import dataclasses
+import itertools
+import math
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Iterator
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ._compat_singledispatchmethod import singledispatchmethod
 from .doc import *
+from .doc import _inline
 from .simple import *
 
 
-class LineWidthExceeded(Exception):
-    pass
+def _cell_widths(doc: Doc) -> Optional[Tuple[int, int, int]]:
+    """
+    Return the widths of a cell that is rendered as a single line of text,
+    or None if its widths can only be determined by rendering it.
+
+    The widths are the width of the rendered cell, the width needed by the
+    first line while the cell is rendered, and the width needed by the other
+    lines while the cell is rendered, which only exist inside an inline.
+    """
+    is_inline = isinstance(doc, Edit) and doc.function is _inline
+    if isinstance(doc, Edit) and is_inline:
+        doc = doc.doc
+    width: int = 0
+    line_width: int = 0
+    first_line_width: Optional[int] = None
+    other_lines_width: int = 0
+    for subdoc in doc.docs if isinstance(doc, Cat) else (doc,):
+        if not isinstance(subdoc, Text):
+            return None
+        if subdoc is Line:
+            if not is_inline:
+                return None
+            if first_line_width is None:
+                first_line_width = line_width + len(Line)
+            else:
+                other_lines_width = max(other_lines_width, line_width + len(Line))
+            line_width = 0
+        else:
+            width += len(subdoc)
+            line_width += len(subdoc)
+    if first_line_width is None:
+        first_line_width = line_width
+    else:
+        other_lines_width = max(other_lines_width, line_width)
+    return (width, first_line_width, other_lines_width)
+
+
+# NOTE: The layouts are keyed by the id of the Alt and its starting column, and
+#       store the narrowest maximum line width at which they were found.
+_SharedLayouts = Dict[Tuple[int, int], Tuple[int, TokenBuffer]]
 
 
 @dataclass
 class SmartDocRenderer(SimpleDocRenderer):
     max_line_width: int = 80
+    # NOTE: The budget of each render, in seconds and in alternatives tried.
+    #       Once it runs out, the first alternative of each Alt is rendered
+    #       without trying the others, and each Group is broken.
+    time_budget: Optional[float] = None
+    alternatives_budget: Optional[int] = None
+
+    shared_layouts: Optional[_SharedLayouts] = field(
+        default=None, init=False, repr=False
+    )
+
+    def to_strs(self, doc: Doc, max_line_widths: Iterable[int]) -> List[str]:
+        """
+        Render a document at each of several maximum line widths.
+
+        The widths are rendered from narrowest to widest. If the last
+        alternative of an Alt fits, and so does the last alternative of every
+        Alt inside it, the same tokens are chosen at every wider width, so
+        they are reused rather than rendered again.
+        """
+        max_line_widths = list(max_line_widths)
+        shared_layouts: _SharedLayouts = {}
+        outputs: Dict[int, str] = {}
+        for max_line_width in sorted(set(max_line_widths)):
+            doc_renderer = dataclasses.replace(self, max_line_width=max_line_width)
+            doc_renderer.shared_layouts = shared_layouts
+            outputs[max_line_width] = doc_renderer.to_str(doc)
+        return [outputs[max_line_width] for max_line_width in max_line_widths]
+
+    def remember_layouts(
+        self, layouts: Iterable[Tuple[Union[Alt, Group], int, TokenBuffer]]
+    ) -> None:
+        if self.shared_layouts is not None:
+            for doc, column, token_buffer in layouts:
+                self.shared_layouts.setdefault(
+                    (id(doc), column), (self.max_line_width, token_buffer)
+                )
+
+    def remembered_layout(self, doc: Union[Alt, Group]) -> Optional[TokenBuffer]:
+        if self.shared_layouts is not None:
+            layout = self.shared_layouts.get((id(doc), self.column), None)
+            if layout is not None and layout[0] <= self.max_line_width:
+                return layout[1]
+        return None
+
+    def new_render_state(self) -> RenderState:
+        """
+        Create the state of a render, with the time and alternatives budgets,
+        which are shared by any renders nested inside it.
+
+        The time budget is wall-clock time, which includes the time that the
+        consumer spends processing the tokens.
+        """
+        state = super().new_render_state()
+        if self.time_budget is not None or self.alternatives_budget is not None:
+            state.deadline = math.inf
+            if self.time_budget is not None:
+                state.deadline = time.perf_counter() + self.time_budget
+            if self.alternatives_budget is not None:
+                state.alternatives_left = self.alternatives_budget
+        return state
+
+    def spend_budget(self) -> bool:
+        """
+        Spend the budget for trying one alternative, and return whether it
+        was within budget. Once the budget runs out, the render is degraded.
+        """
+        state = self.state
+        if state.degraded:
+            return False
+        if state.alternatives_left < 1 or time.perf_counter() > cast(
+            float, state.deadline
+        ):
+            state.degraded = True
+            return False
+        state.alternatives_left -= 1
+        return True
 
-    def render(self, doc: Doc) -> TokenStream:
-        yield from self.render_with_lookahead(doc)
+    def render_node(self, doc: Doc) -> TokenStream:
+        return self.render_with_lookahead(doc)
+
+    def try_flat(self, doc: Group) -> bool:
+        if self.stats is not None:
+            self.stats.alts_visited += 1
+        return self.state.deadline is None or self.spend_budget()
+
+    def fill_separator(self, column: int) -> Token:
+        # NOTE: This mirrors trying the Space of a SoftLine in strict mode, so
+        #       a Line counts as a narrowed Alt.
+        if column + len(Space) <= self.max_line_width:
+            return Space
+        self.state.narrowed_alts += 1
+        return Line
+
+    def alternatives(self, doc: Alt) -> Tuple[Iterable[Doc], Optional[Doc]]:
+        if self.stats is not None:
+            self.stats.alts_visited += 1
+        fallback, *alts = doc.alts
+        candidates: Iterable[Doc] = (
+            alt
+            for alt in reversed(alts)
+            if not (
+                isinstance(alt, (Table, TextTable)) and self.table_fits(alt) is False
+            )
+        )
+        # NOTE: The budget is spent as each alternative is tried, so if it runs
+        #       out while an alternative is tried, the remaining alternatives
+        #       are skipped if that alternative does not fit.
+        if self.state.deadline is not None:
+            candidates = itertools.takewhile(lambda _: self.spend_budget(), candidates)
+        return (candidates, fallback)
 
     ###########################################################################
     # Strict Mode & Raising Errors when Max Line Width is Exceeded
     ###########################################################################
 
-    is_strict: bool = field(default=False, init=False)
+    @property
+    def is_strict(self) -> bool:
+        return self.state.is_strict
 
-    def strict_emit(self, token: Token) -> Token:
-        if self.column + len(token) > self.max_line_width:
-            raise LineWidthExceeded()
-        else:
-            return token
+    def strict_emit_batch(
+        self, tokens: Sequence[Token], line: int, column: int
+    ) -> None:
+        max_line_width = self.max_line_width
+        for token in tokens:
+            # NOTE: The final Line must fit as well.
+            column += len(token.text)
+            if column > max_line_width:
+                if self.stats is not None:
+                    self.stats.line_width_exceeded += 1
+                raise LineWidthExceeded()
+            if token is Line:
+                column = 0
 
     @contextmanager
     def strict(self) -> Iterator[None]:
-        self.on_emit.append(self.strict_emit)
+        state = self.state
+        is_strict = state.is_strict
+        # NOTE: The line width is checked once per token, however many strict
+        #       blocks are nested.
+        if not is_strict:
+            state.on_emit_batch.append(self.strict_emit_batch)
+        state.is_strict = True
         try:
             yield None
         finally:
-            self.on_emit.remove(self.strict_emit)
+            if not is_strict:
+                state.on_emit_batch.remove(self.strict_emit_batch)
+            state.is_strict = is_strict
 
     @singledispatchmethod
     def render_with_lookahead(
@@ -44,26 +222,81 @@ class SmartDocRenderer(SimpleDocRenderer):
     ) -> TokenStream:
         yield from self.render_simple(doc)
 
-    @render_with_lookahead.register
-    def _(self, doc: Cat, *, width_hint: WidthHint = Unknown) -> TokenStream:
-        for subdoc_width_hint, subdoc in zip(
-            doc.width_hints(initial=width_hint), doc.docs
-        ):
-            yield from self.render_with_lookahead(subdoc, width_hint=subdoc_width_hint)
-
     @render_with_lookahead.register
     def _(self, doc: Alt, *, width_hint: WidthHint = Unknown) -> TokenStream:
-        fallback, *alts = doc.alts
-        succeeded = False
-        for alt in reversed(alts):
-            with self.strict():
-                try:
-                    token_stream = self.render_simple(alt)
-                    token_buffer = self.buffer_stream(token_stream)
-                except LineWidthExceeded:
-                    continue
-                succeeded = True
-                yield from map(self.emit, token_buffer)
-                break
-        if not succeeded:
-            yield from self.render(fallback)
+        yield from self.render(doc)
+
+    def table_fits(self, table: Union[Table, TextTable]) -> Optional[bool]:
+        """
+        Check whether a table fits within the maximum line width, using only
+        the widths of its cells, without rendering it.
+
+        Returns None if any cell is not a single line of text.
+        """
+        if isinstance(table, TextTable):
+            return self.text_table_fits(table)
+        # NOTE: This mirrors the checks made by strict_emit, when the table is
+        #       rendered in strict mode: every cell of a window is buffered at
+        #       the column where the window starts, which is the current column
+        #       for the first window and zero after that, and every row,
+        #       including its final Line, must fit.
+        column = window_column = self.column
+        for rows in table.windows():
+            cell_widths: List[List[int]] = []
+            for row in rows:
+                row_widths: List[int] = []
+                for cell in row.cells:
+                    widths = _cell_widths(cell)
+                    if widths is None:
+                        return None
+                    width, first_line_width, other_lines_width = widths
+                    if (
+                        window_column + max(width, first_line_width)
+                        > self.max_line_width
+                        or other_lines_width > self.max_line_width
+                    ):
+                        return False
+                    row_widths.append(width)
+                cell_widths.append(row_widths)
+            min_col_widths = (
+                [width or 0 for width in row.info.min_col_widths] for row in rows
+            )
+            col_widths = tuple(
+                map(
+                    max,
+                    itertools.zip_longest(*cell_widths, *min_col_widths, fillvalue=0),
+                )
+            )
+            for row, row_widths in zip(rows, cell_widths):
+                for j, width in enumerate(row_widths):
+                    if j < len(row_widths) - 1:
+                        column += col_widths[j] + len(row.info.hsep)
+                    else:
+                        column += width
+                if column + len(Line) > self.max_line_width:
+                    return False
+                column = 0
+            window_column = 0
+        return True
+
+    def text_table_fits(self, table: TextTable) -> bool:
+        # NOTE: The rows of a TextTable are not buffered, but the decision must
+        #       agree with that for the same Table, so every cell must fit at
+        #       the column where its window starts, as checked by table_fits.
+        column = window_column = self.column
+        hsep_width = len(table.info.hsep)
+        for cells in table.windows():
+            cell_widths = [len(cell) for row_cells in cells for cell in row_cells]
+            if cell_widths and window_column + max(cell_widths) > self.max_line_width:
+                return False
+            col_widths = table.col_widths(cells)
+            for row_cells in cells:
+                if row_cells:
+                    last = len(row_cells) - 1
+                    column += sum(col_widths[:last]) + hsep_width * last
+                    column += len(row_cells[last])
+                if column + len(Line) > self.max_line_width:
+                    return False
+                column = 0
+            window_column = 0
+        return True
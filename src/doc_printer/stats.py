@@ -0,0 +1,265 @@
+import dataclasses
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Tuple, cast
+
+from .doc import *
+
+
+@dataclass
+class NodeStats:
+    """
+    The number of times documents of some type were rendered, and the total
+    time spent rendering them, including the time spent rendering their
+    subdocuments.
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class RenderStats:
+    """
+    Statistics collected while rendering documents.
+
+    Attach an instance to a renderer using its stats field. If the stats
+    field is None, which is the default, no statistics are collected.
+    """
+
+    tokens_emitted: int = 0
+    alts_visited: int = 0
+    alternatives_tried: int = 0
+    alternatives_failed: int = 0
+    line_width_exceeded: int = 0
+    buffers: int = 0
+    buffered_tokens: int = 0
+    peak_buffer_size: int = 0
+    nodes: Dict[str, NodeStats] = field(default_factory=dict)
+    # NOTE: The renders are counted by the id of each document, since
+    #       comparing documents by structure is slow, and the documents are
+    #       kept, so that they can be reported and their ids are not reused.
+    renders: "Counter[int]" = field(default_factory=Counter, repr=False)
+    rendered_docs: Dict[int, Doc] = field(default_factory=dict, repr=False)
+
+    def visit(self, doc: Doc) -> NodeStats:
+        """
+        Count the rendering of a document, and return the statistics for
+        its type, to which the time spent rendering it should be added.
+        """
+        # NOTE: Tokens are cheap to render, so their renders are not counted.
+        if type(doc) is not Text:
+            key = id(doc)
+            if key in self.renders:
+                self.renders[key] += 1
+            else:
+                self.renders[key] = 1
+                self.rendered_docs[key] = doc
+        node_stats = self.nodes.setdefault(type(doc).__name__, NodeStats())
+        node_stats.count += 1
+        return node_stats
+
+    def buffered(self, buffer_size: int) -> None:
+        self.buffers += 1
+        self.buffered_tokens += buffer_size
+        self.peak_buffer_size = max(self.peak_buffer_size, buffer_size)
+
+    def rerenders(self, top: int = 10) -> List[Tuple[Doc, int]]:
+        """
+        Return the subdocuments, other than tokens, that were rendered more
+        than once, and the number of times they were rendered again, most
+        frequent first.
+        """
+        return [
+            (self.rendered_docs[key], count - 1)
+            for key, count in self.renders.most_common(top)
+            if count > 1
+        ]
+
+    def to_dict(self, *, top: int = 10) -> Dict[str, Any]:
+        """
+        Summarize the statistics as a dictionary, e.g., for logging.
+        """
+        return {
+            "tokens_emitted": self.tokens_emitted,
+            "alts_visited": self.alts_visited,
+            "alternatives_tried": self.alternatives_tried,
+            "alternatives_failed": self.alternatives_failed,
+            "line_width_exceeded": self.line_width_exceeded,
+            "buffers": self.buffers,
+            "buffered_tokens": self.buffered_tokens,
+            "peak_buffer_size": self.peak_buffer_size,
+            "nodes": {
+                name: {"count": node_stats.count, "seconds": node_stats.seconds}
+                for name, node_stats in sorted(self.nodes.items())
+            },
+            "rerenders": [
+                {"doc": _summarize(doc), "count": count}
+                for doc, count in self.rerenders(top)
+            ],
+        }
+
+    def summary(self, *, top: int = 10) -> str:
+        """
+        Summarize the statistics as text, e.g., for logging.
+        """
+        kvs = self.to_dict(top=top)
+        lines: List[str] = []
+        for key, value in kvs.items():
+            if key == "nodes":
+                for name, node_stats in value.items():
+                    lines.append(
+                        f"{name}: {node_stats['count']} renders, "
+                        f"{node_stats['seconds']:.6f}s"
+                    )
+            elif key == "rerenders":
+                for rerender in value:
+                    lines.append(
+                        f"rerendered {rerender['count']} times: {rerender['doc']}"
+                    )
+            else:
+                lines.append(f"{key}: {value}")
+        return "\n".join(lines)
+
+
+def _summarize(doc: Doc, max_length: int = 60) -> str:
+    text = repr(doc)
+    if len(text) > max_length:
+        text = text[: max_length - 3] + "..."
+    return text
+
+
+@dataclass
+class DocStats:
+    """
+    Statistics about the structure of a document.
+
+    Documents may share subdocuments. The nodes, node_counts, alts, and
+    branching factors count each shared subdocument once for every place it
+    occurs, as seen by a renderer, whereas the unique_nodes and shared_nodes
+    count the distinct objects.
+    """
+
+    nodes: int = 0
+    node_counts: Dict[str, int] = field(default_factory=dict)
+    max_depth: int = 0
+    alts: int = 0
+    max_branching: int = 0
+    mean_branching: float = 0.0
+    worst_case_alternatives: int = 0
+    tables: List[Tuple[int, int]] = field(default_factory=list)
+    unique_nodes: int = 0
+    shared_nodes: int = 0
+    distinct_subtrees: int = 0
+    memory: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the statistics as a dictionary, e.g., for logging.
+        """
+        return dataclasses.asdict(self)
+
+
+# NOTE: Doc is an abstract base class, which makes isinstance slow, so the
+#       subdocuments are looked up by the exact type of the document.
+_SUBDOCS: Dict[type, Callable[[Any], Sequence[Doc]]] = {
+    Cat: lambda doc: doc.docs,
+    Alt: lambda doc: doc.alts,
+    Group: lambda doc: (doc.doc,),
+    Fill: lambda doc: doc.docs,
+    Nest: lambda doc: (doc.doc,),
+    Edit: lambda doc: (doc.doc,),
+    Row: lambda doc: doc.cells,
+    Table: lambda doc: doc.rows,
+}
+
+
+def _subdocs(doc: Doc) -> Sequence[Doc]:
+    get_subdocs = _SUBDOCS.get(type(doc), None)
+    return () if get_subdocs is None else get_subdocs(doc)
+
+
+def _sizeof(doc: Doc) -> int:
+    size = sys.getsizeof(doc) + sys.getsizeof(vars(doc))
+    for value in vars(doc).values():
+        if isinstance(value, (str, tuple)):
+            size += sys.getsizeof(value)
+        if isinstance(value, tuple) and value and isinstance(value[0], tuple):
+            size += sum(map(sys.getsizeof, value))
+            size += sum(sys.getsizeof(cell) for cells in value for cell in cells)
+    return size
+
+
+def doc_stats(doc: Doc) -> DocStats:
+    """
+    Compute statistics about the structure of a document.
+
+    The document is traversed iteratively, visiting each distinct object
+    once, so shared subdocuments do not make the traversal exponential.
+
+    The worst-case number of alternatives explored is the number of
+    alternatives a renderer tries if every alternative but the fallback
+    fails, including the alternatives inside those alternatives.
+    """
+    # Order the distinct subdocuments so that each comes after its subdocuments
+    order: List[Doc] = []
+    subdocs_by_id: Dict[int, Sequence[Doc]] = {}
+    stack: List[Tuple[Doc, bool]] = [(doc, False)]
+    while stack:
+        subdoc, expanded = stack.pop()
+        if expanded:
+            order.append(subdoc)
+        elif id(subdoc) not in subdocs_by_id:
+            subdocs = subdocs_by_id[id(subdoc)] = _subdocs(subdoc)
+            stack.append((subdoc, True))
+            stack.extend((child, False) for child in reversed(subdocs))
+    # Count the occurrences of each subdocument, from the top down
+    occurrences: Dict[int, int] = {id(doc): 1}
+    parents: Dict[int, int] = {}
+    for subdoc in reversed(order):
+        subdoc_occurrences = occurrences[id(subdoc)]
+        for child in subdocs_by_id[id(subdoc)]:
+            occurrences[id(child)] = occurrences.get(id(child), 0) + subdoc_occurrences
+            parents[id(child)] = parents.get(id(child), 0) + 1
+    # Compute the statistics, from the bottom up
+    stats = DocStats()
+    depths: Dict[int, int] = {}
+    alternatives: Dict[int, int] = {}
+    branching: int = 0
+    for subdoc in order:
+        subdocs = subdocs_by_id[id(subdoc)]
+        subdoc_occurrences = occurrences[id(subdoc)]
+        subdoc_type = type(subdoc)
+        name = subdoc_type.__name__
+        stats.nodes += subdoc_occurrences
+        stats.node_counts[name] = stats.node_counts.get(name, 0) + subdoc_occurrences
+        depths[id(subdoc)] = 1 + max(
+            (depths[id(child)] for child in subdocs), default=0
+        )
+        alternatives[id(subdoc)] = sum(alternatives[id(child)] for child in subdocs)
+        if subdoc_type is Alt:
+            alternatives[id(subdoc)] += len(subdocs)
+            stats.alts += subdoc_occurrences
+            stats.max_branching = max(stats.max_branching, len(subdocs))
+            branching += subdoc_occurrences * len(subdocs)
+        if subdoc_type is Group:
+            # NOTE: A Group is an Alt whose two alternatives share their doc.
+            alternatives[id(subdoc)] = 2 * alternatives[id(subdoc)] + 2
+            stats.alts += subdoc_occurrences
+            stats.max_branching = max(stats.max_branching, 2)
+            branching += subdoc_occurrences * 2
+        if subdoc_type is Table:
+            n_cols = max((len(_subdocs(row)) for row in subdocs), default=0)
+            stats.tables.append((len(subdocs), n_cols))
+        if subdoc_type is TextTable:
+            cells = cast(TextTable, subdoc).cells
+            stats.tables.append((len(cells), max(map(len, cells), default=0)))
+        stats.memory += _sizeof(subdoc)
+    stats.max_depth = depths[id(doc)]
+    stats.mean_branching = branching / stats.alts if stats.alts else 0.0
+    stats.worst_case_alternatives = alternatives[id(doc)]
+    stats.unique_nodes = len(order)
+    stats.shared_nodes = sum(1 for count in parents.values() if count > 1)
+    stats.distinct_subtrees = len(set(order))
+    return stats
@@ -0,0 +1,15 @@
+from doc_printer import Doc, Line, SoftLine, Text, nest
+
+
+def section(i: int, n: int) -> Doc:
+    """
+    Create a numbered section with n words that wrap below its header.
+    """
+    return Text(f"{i}:") // nest(2, SoftLine.join(str(j) for j in range(n)))
+
+
+def sections(n: int) -> Doc:
+    """
+    Create a document with n sections on separate lines.
+    """
+    return Line.join(section(i, i) for i in range(n))
@@ -0,0 +1,84 @@
+import asyncio
+from typing import List
+
+from doc_printer import Line, SmartDocRenderer, nest
+
+from .sections import sections
+
+DOC = sections(40)
+
+
+def test_to_str_async() -> None:
+    exp = SmartDocRenderer(max_line_width=12).to_str(DOC)
+    smart = SmartDocRenderer(max_line_width=12)
+    act = asyncio.run(smart.to_str_async(DOC, chunk_size=16))
+    assert act == exp
+
+
+def test_to_str_async_gather() -> None:
+    docs = [Line.join([DOC] * n) for n in range(1, 5)]
+    exp = [SmartDocRenderer(max_line_width=12).to_str(doc) for doc in docs]
+    smart = SmartDocRenderer(max_line_width=12)
+
+    async def main() -> List[str]:
+        return list(
+            await asyncio.gather(
+                *(smart.to_str_async(doc, chunk_size=16) for doc in docs)
+            )
+        )
+
+    assert asyncio.run(main()) == exp
+
+
+def test_render_async_yields_to_event_loop() -> None:
+    ticks: List[int] = []
+
+    async def tick() -> None:
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main() -> int:
+        ticker = asyncio.ensure_future(tick())
+        smart = SmartDocRenderer(max_line_width=12)
+        chunks = [chunk async for chunk in smart.render_async(DOC, chunk_size=16)]
+        ticker.cancel()
+        return len(chunks)
+
+    n_chunks = asyncio.run(main())
+    assert n_chunks > 1
+    assert len(ticks) >= n_chunks - 1
+
+
+def test_render_async_yields_while_buffering() -> None:
+    ticks: List[int] = []
+
+    async def tick() -> None:
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main() -> int:
+        ticker = asyncio.ensure_future(tick())
+        smart = SmartDocRenderer(max_line_width=12)
+        render = smart.render_async(nest(2, DOC), interval=0.0)
+        await render.__anext__()
+        n_ticks = len(ticks)
+        await render.aclose()
+        ticker.cancel()
+        return n_ticks
+
+    # The whole document is buffered by the Nest, but the event loop runs
+    # before its first chunk is yielded
+    assert asyncio.run(main()) > 10
+
+
+def test_render_async_cancel() -> None:
+    async def main() -> str:
+        smart = SmartDocRenderer(max_line_width=12)
+        render = smart.render_async(DOC, chunk_size=16)
+        chunk = await render.__anext__()
+        await render.aclose()
+        return chunk
+
+    assert len(asyncio.run(main())) > 0
@@ -0,0 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import raises
+
+from doc_printer import (
+    CachedDocRenderer,
+    IncrementalDocRenderer,
+    Line,
+    LineWidthExceeded,
+    RenderCache,
+    RenderStats,
+    SimpleDocRenderer,
+    SimpleLayout,
+    SmartDocRenderer,
+    SpeculativeDocRenderer,
+    Text,
+    Token,
+    content_key,
+    row,
+)
+
+from .sections import sections
+
+DOC = sections(10)
+
+
+def test_content_key() -> None:
+    assert content_key(DOC) == content_key(DOC.to_dict())
+    assert content_key(DOC) != content_key(Line.join([DOC, DOC]))
+
+
+def test_render_cached(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache.db")
+    smart = CachedDocRenderer(cache, SmartDocRenderer(max_line_width=12))
+    exp = SmartDocRenderer(max_line_width=12).to_str(DOC)
+    assert smart.to_str(DOC) == exp
+    assert smart.to_str_from_dict(DOC.to_dict()) == exp
+    # The renderer configuration is part of the key
+    simple = CachedDocRenderer(
+        cache, SimpleDocRenderer(simple_layout=SimpleLayout.LongestLines)
+    )
+    assert simple.to_str(DOC) == SimpleDocRenderer(
+        simple_layout=SimpleLayout.LongestLines
+    ).to_str(DOC)
+    cache.close()
+    # The output persists across connections
+    cache = RenderCache(tmp_path / "cache.db")
+    smart = CachedDocRenderer(cache, SmartDocRenderer(max_line_width=12))
+    assert cache.get(smart.key(DOC)) == exp
+    cache.put(smart.key(DOC), "cached")
+    assert smart.to_str(DOC) == "cached"
+    cache.close()
+
+
+def test_content_key_None() -> None:
+    kvs = row("a", "b").to_dict()
+    assert kvs["info"]["align_window"] is None
+    del kvs["info"]["align_window"]
+    # An entry whose value is None is the same as an omitted entry
+    assert content_key(kvs) == content_key(row("a", "b"))
+
+
+def test_render_cached_callbacks(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache.db")
+    smart = CachedDocRenderer(cache, SmartDocRenderer(max_line_width=12))
+    assert smart.to_str(Text(":")) == ":"
+
+    # A renderer with callbacks, which may edit tokens, bypasses the cache
+    def semicolon(token: Token) -> Token:
+        return Text(";") if token == Text(":") else token
+
+    doc_renderer = SmartDocRenderer(max_line_width=12, on_emit=[semicolon])
+    assert CachedDocRenderer(cache, doc_renderer).to_str(Text(":")) == ";"
+    # So does a renderer in strict mode, which may reject tokens
+    narrow = SmartDocRenderer(max_line_width=1)
+    assert CachedDocRenderer(cache, narrow).to_str(Text("::")) == "::"
+    with narrow.strict(), raises(LineWidthExceeded):
+        CachedDocRenderer(cache, narrow).to_str(Text("::"))
+    cache.close()
+
+
+def test_render_cached_key(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache.db")
+    smart = CachedDocRenderer(cache, SmartDocRenderer(max_line_width=12))
+    key = smart.key(DOC)
+    # The key only depends on the fields that affect the output
+    stats = SmartDocRenderer(max_line_width=12, stats=RenderStats())
+    assert CachedDocRenderer(cache, stats).key(DOC) == key
+    with ThreadPoolExecutor() as executor1, ThreadPoolExecutor() as executor2:
+        speculative1 = SpeculativeDocRenderer(max_line_width=12, executor=executor1)
+        speculative2 = SpeculativeDocRenderer(max_line_width=12, executor=executor2)
+        assert CachedDocRenderer(cache, speculative1).key(DOC) == (
+            CachedDocRenderer(cache, speculative2).key(DOC)
+        )
+    wide = SmartDocRenderer(max_line_width=13)
+    assert CachedDocRenderer(cache, wide).key(DOC) != key
+    incremental = IncrementalDocRenderer(SmartDocRenderer(max_line_width=12))
+    wide_incremental = IncrementalDocRenderer(wide)
+    assert CachedDocRenderer(cache, incremental).key(DOC) != (
+        CachedDocRenderer(cache, wide_incremental).key(DOC)
+    )
+    # The key depends on the version of this package
+    with patch("doc_printer.cache.__version__", "0.0.0"):
+        assert smart.key(DOC) != key
+    cache.close()
+
+
+def test_render_cached_budget(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache.db")
+    smart = SmartDocRenderer(max_line_width=12, alternatives_budget=0)
+    cached = CachedDocRenderer(cache, smart)
+    assert cached.to_str(DOC) == SimpleDocRenderer().to_str(DOC)
+    assert smart.degraded
+    # A degraded output is not cached, and the budget is not part of the key
+    assert cache.get(cached.key(DOC)) is None
+    smart.alternatives_budget = None
+    assert cached.to_str(DOC) == SmartDocRenderer(max_line_width=12).to_str(DOC)
+    smart.alternatives_budget = 0
+    assert cache.get(cached.key(DOC)) is not None
+    cache.close()
+
+
+def test_render_cache_evict(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache.db", max_size=10)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    cache.get("a")
+    cache.put("c", "12345")
+    assert cache.get("a") == "12345"
+    assert cache.get("b") is None
+    assert cache.get("c") == "12345"
+    # The total size is kept up to date, when an entry is replaced
+    cache.put("c", "123")
+    assert cache.size == 8
+    cache.close()
+    # The total size persists across connections
+    cache = RenderCache(tmp_path / "cache.db", max_size=10)
+    assert cache.size == 8
+    cache.put("d", "12345")
+    assert cache.size == 8
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_render_cached_threads(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache.db")
+    smart = CachedDocRenderer(cache, SmartDocRenderer(max_line_width=12))
+    docs = [Line.join([DOC, Text(str(i))]) for i in range(10)]
+    exp = [SmartDocRenderer(max_line_width=12).to_str(doc) for doc in docs]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(smart.to_str, docs * 4)) == exp * 4
+    cache.close()
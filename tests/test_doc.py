@@ -1,15 +1,30 @@
+import copy
+import pickle
+
 from doc_printer import (
     Alt,
+    Cat,
+    Doc,
     Empty,
     Fail,
+    Fill,
+    Group,
     Line,
+    Row,
+    SmartDocRenderer,
     SoftLine,
     Space,
     Text,
     Unknown,
     WidthHint,
     cat,
+    fill,
+    group,
     nest,
+    row,
+    smart_quote,
+    table,
+    text_table,
 )
 
 
@@ -97,3 +112,78 @@ def test_Cat_with_auto_Space() -> None:
 
 def test_None_DocLike() -> None:
     assert cat(None, None, None) is Empty
+
+
+def test_Doc_hash() -> None:
+    def make() -> Doc:
+        return nest(2, cat("hello world", Line, SoftLine, "wello horld") | "hello")
+
+    assert make() == make()
+    assert hash(make()) == hash(make())
+    assert make() != nest(4, cat("hello world", Line, SoftLine, "wello horld"))
+    assert {make(): 1}[make()] == 1
+
+
+def test_Table_hash() -> None:
+    def make(hsep: str = " ") -> Doc:
+        rows = [row("hello", "world", hsep=hsep) for _ in range(2)]
+        return table(cell for cell in rows if isinstance(cell, Row))
+
+    assert make() == make()
+    assert hash(make()) == hash(make())
+    assert make() != make(hsep=",")
+
+
+def test_TextTable_to_dict() -> None:
+    doc = text_table([["hello", "world"], ["hi"]], hsep=",", min_col_widths=(8,))
+    assert Doc.from_dict(doc.to_dict()) == doc
+    assert hash(Doc.from_dict(doc.to_dict())) == hash(doc)
+    assert doc != text_table([["hello", "world"], ["hi"]], hsep=",")
+
+
+def test_Doc_pickle() -> None:
+    shared = nest(2, smart_quote("it's", Line, "fine") | "ok")
+    rows = [row("hello", shared, hsep=",") for _ in range(2)]
+    doc = cat(
+        shared,
+        SoftLine,
+        table(cell for cell in rows if isinstance(cell, Row)),
+        Line,
+        text_table([["hello", "world"], ["hi"]], min_col_widths=(8,)),
+        shared,
+    )
+    act = pickle.loads(pickle.dumps(doc))
+    assert act == doc
+    assert hash(act) == hash(doc)
+    assert SmartDocRenderer(max_line_width=8).to_str(act) == SmartDocRenderer(
+        max_line_width=8
+    ).to_str(doc)
+    # The singletons are unpickled as the same objects
+    assert isinstance(act, Cat)
+    assert act.docs[1] is SoftLine
+    assert act.docs[3] is Line
+    for singleton in (Empty, Space, Line, Fail, SoftLine):
+        assert pickle.loads(pickle.dumps(singleton)) is singleton
+        assert copy.deepcopy(singleton) is singleton
+    # The shared subdocuments are unpickled as the same object
+    assert act.docs[0] is act.docs[-1]
+
+
+def test_Group() -> None:
+    doc = group(cat("hello", Line, "world"))
+    assert isinstance(doc, Group)
+    assert group(doc) is doc
+    assert group(None) is Empty
+    assert Doc.from_dict(doc.to_dict()) == doc
+    assert pickle.loads(pickle.dumps(doc)) == doc
+
+
+def test_Fill() -> None:
+    doc = Text.fill_words("hello  world")
+    assert isinstance(doc, Fill)
+    assert doc.docs == (Text("hello"), Text("world"))
+    assert fill(doc, "again") == Fill((*doc.docs, Text("again")))
+    assert fill("hello") == Text("hello")
+    assert fill(None) is Empty
+    assert Doc.from_dict(doc.to_dict()) == doc
+    assert pickle.loads(pickle.dumps(doc)) == doc
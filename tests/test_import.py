@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+from pytest import mark
+
+# NOTE: These modules are slow to import, and are not needed to build and
+#       render documents.
+SLOW_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "dataclasses_json",
+    "marshmallow",
+    "more_itertools",
+    "sqlite3",
+)
+
+
+def imported_modules(statement: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print(*sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@mark.parametrize("module", SLOW_MODULES)
+def test_import_is_lazy(module: str) -> None:
+    modules = imported_modules(
+        "import doc_printer; "
+        "doc_printer.SmartDocRenderer().to_str(doc_printer.Text('x'))"
+    ).split()
+    assert module not in modules
+
+
+def test_import_lazy_exports() -> None:
+    modules = imported_modules(
+        "from doc_printer import RenderCache, SpeculativeDocRenderer"
+    ).split()
+    assert "sqlite3" in modules
+    assert "concurrent.futures" in modules
+
+
+def test_import_submodules() -> None:
+    import doc_printer
+    import doc_printer.buffer
+
+    # The table function does not shadow the module of table buffers
+    assert callable(doc_printer.table)
+    table_buffer = doc_printer.SimpleDocRenderer().buffer_rows(())
+    assert isinstance(table_buffer, doc_printer.buffer.TableBuffer)
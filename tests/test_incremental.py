@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from doc_printer import IncrementalDocRenderer, Line, SmartDocRenderer
+
+from .sections import section, sections
+
+
+def test_render_incremental() -> None:
+    incremental = IncrementalDocRenderer(SmartDocRenderer(max_line_width=12))
+    doc1 = sections(10)
+    update1 = incremental.update(doc1)
+    assert update1.text == SmartDocRenderer(max_line_width=12).to_str(doc1)
+    assert update1.old_lines == range(0, 0)
+    assert update1.lines == range(0, len(update1.text.splitlines()))
+    # Change a single section
+    doc2 = Line.join(section(i, 8 if i == 5 else i) for i in range(10))
+    token_buffers = list(incremental.token_buffers)
+    with patch.object(
+        incremental, "render_segment", wraps=incremental.render_segment
+    ) as render_segment:
+        update2 = incremental.update(doc2)
+    # Only the changed section is rendered, the others keep their tokens
+    assert render_segment.call_count == 1
+    assert [
+        new is old for new, old in zip(incremental.token_buffers, token_buffers)
+    ] == [i != 5 for i in range(10)]
+    assert update2.text == SmartDocRenderer(max_line_width=12).to_str(doc2)
+    assert update2.lines == range(5, 7)
+    assert update2.old_lines == range(5, 6)
+    assert update2.text.splitlines()[:5] == update1.text.splitlines()[:5]
+    assert update2.text.splitlines()[7:] == update1.text.splitlines()[6:]
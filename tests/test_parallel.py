@@ -0,0 +1,73 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from doc_printer import (
+    Line,
+    ParallelDocRenderer,
+    SmartDocRenderer,
+    SpeculativeDocRenderer,
+    Text,
+    alt,
+    cat,
+    group,
+    segments,
+)
+
+from .sections import sections
+
+
+def test_segments() -> None:
+    doc = cat("a b", Line, "c", Line, Line, "d")
+    assert list(segments(doc)) == [
+        cat("a b", Line),
+        cat("c", Line),
+        Line,
+        Text("d"),
+    ]
+
+
+def test_render_parallel() -> None:
+    doc = sections(40)
+    exp = SmartDocRenderer(max_line_width=12).to_str(doc)
+    parallel = ParallelDocRenderer(
+        doc_renderer=SmartDocRenderer(max_line_width=12), max_workers=2
+    )
+    assert parallel.to_str(doc) == exp
+    # The process pool is created once, and reused until it is closed
+    process_pool = parallel.process_pool
+    assert process_pool is not None
+    assert "".join(token.text for token in parallel.render(doc)) == exp
+    assert parallel.process_pool is process_pool
+    parallel.close()
+    assert parallel.process_pool is None
+    # The segments may be rendered using another executor
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = ParallelDocRenderer(
+            doc_renderer=SmartDocRenderer(max_line_width=12),
+            max_workers=2,
+            executor=executor,
+        )
+        assert parallel.to_str(doc) == exp
+        assert parallel.process_pool is None
+
+
+def test_render_speculative() -> None:
+    doc = sections(20)
+    doc = Line.join([doc, doc | Text("x") // doc])
+    exp = SmartDocRenderer(max_line_width=12).to_str(doc)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        speculative = SpeculativeDocRenderer(
+            max_line_width=12, executor=executor, min_alt_size=10
+        )
+        assert speculative.to_str(doc) == exp
+
+
+def test_render_speculative_Group() -> None:
+    body = alt(cat("aaaa", Line, "bbbb"), cat("aaaa", "XXX", Line, "bbbb"))
+    doc = cat("f(", group(cat(Line, body, Line)), ")")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for max_line_width in range(8, 16):
+            exp = SmartDocRenderer(max_line_width=max_line_width).to_str(doc)
+            speculative = SpeculativeDocRenderer(
+                max_line_width=max_line_width, executor=executor, min_alt_size=1
+            )
+            assert speculative.to_str(doc) == exp
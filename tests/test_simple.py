@@ -1,12 +1,25 @@
+from typing import List, Sequence, Tuple
+
 from doc_printer import (
+    Doc,
+    Edit,
     Line,
     Nest,
+    Row,
     SimpleDocRenderer,
     Space,
     Text,
+    Token,
+    TokenStream,
+    alt,
+    cat,
     double_quote,
+    row,
     single_quote,
     smart_quote,
+    table,
+    text_table,
+    text_table_from_columns,
 )
 
 
@@ -130,3 +143,137 @@ def test_smart_quote() -> None:
     act = simple.to_str(doc)
     exp = '"\'hello\' \\"world\\""'
     assert act == exp
+
+
+def test_render_Table() -> None:
+    simple = SimpleDocRenderer()
+    rows = [
+        row("a", "bbb", "c"),
+        row("aaaa", "b"),
+        row("aa", "b", "cc", "d", min_col_widths=(0, 5)),
+    ]
+    doc = table(row for row in rows if isinstance(row, Row))
+    exp = "\n".join(
+        [
+            "a    bbb   c",
+            "aaaa b",
+            "aa   b     cc d",
+            "",
+        ]
+    )
+    assert simple.to_str(doc) == exp
+
+
+def test_render_Table_align_window() -> None:
+    simple = SimpleDocRenderer()
+    rows = [row("a", "b"), row("aaa", "b"), row("a", "b"), row("aa", "b")]
+    doc = table((row for row in rows if isinstance(row, Row)), align_window=2)
+    exp = "\n".join(
+        [
+            "a   b",
+            "aaa b",
+            "a  b",
+            "aa b",
+            "",
+        ]
+    )
+    assert simple.to_str(doc) == exp
+
+
+def test_render_Table_align_window_lazy() -> None:
+    cells: List[str] = []
+
+    def spy(token_stream: TokenStream) -> TokenStream:
+        for token in token_stream:
+            cells.append(token.text)
+            yield token
+
+    rows = [row(Edit(spy, Text(f"a{i}")), Edit(spy, Text(f"b{i}"))) for i in range(4)]
+    doc = table((row for row in rows if isinstance(row, Row)), align_window=2)
+    tokens = iter(SimpleDocRenderer().render(doc))
+    # The later windows are not rendered until the earlier ones are consumed
+    for window in range(2):
+        texts = [next(tokens).text for _ in range(8)]
+        assert (
+            "".join(texts)
+            == f"a{2 * window} b{2 * window}\na{2 * window + 1} b{2 * window + 1}\n"
+        )
+        assert cells == [f"{c}{i}" for i in range(2 * window + 2) for c in "ab"]
+    assert next(tokens, None) is None
+
+
+def test_render_TextTable() -> None:
+    simple = SimpleDocRenderer()
+    rows = [["a", "bbb", "c"], ["aaaa", "b b"], [], ["", "b"]]
+    doc = text_table(rows, hsep="|")
+    exp = "\n".join(
+        [
+            "a   |bbb|c",
+            "aaaa|b b",
+            "",
+            "    |b",
+            "",
+        ]
+    )
+    assert simple.to_str(doc) == exp
+    # Rendering a TextTable is equivalent to rendering the same Table
+    exp_doc = table(
+        row for row in (row(*cells, hsep="|") for cells in rows) if isinstance(row, Row)
+    )
+    assert SimpleDocRenderer().to_str(exp_doc) == exp
+
+
+def test_render_TextTable_from_columns() -> None:
+    simple = SimpleDocRenderer()
+    columns = [["a", "aaa", "a"], ["b"], ["c", "c"]]
+    doc = text_table_from_columns(columns, align_window=2)
+    exp = "\n".join(
+        [
+            "a   b c",
+            "aaa   c",
+            "a",
+            "",
+        ]
+    )
+    assert simple.to_str(doc) == exp
+
+
+def test_on_emit_batch() -> None:
+    doc = Text("label:") // Nest(2, Text("a") / Line / Text("b"), overlap=True)
+    positions: List[Tuple[str, int, int]] = []
+
+    def on_emit_batch(tokens: Sequence[Token], line: int, column: int) -> None:
+        for token in tokens:
+            positions.append((token.text, line, column))
+            if token is Line:
+                line, column = line + 1, 0
+            else:
+                column += len(token)
+
+    simple = SimpleDocRenderer(on_emit_batch=[on_emit_batch])
+    exp = "\n".join(
+        [
+            "label: a",
+            "  b",
+        ]
+    )
+    assert simple.to_str(doc) == exp
+    # The positions are the positions seen by per-token callbacks
+    exp_positions: List[Tuple[str, int, int]] = []
+    exp_simple = SimpleDocRenderer()
+
+    def on_emit(token: Token) -> Token:
+        exp_positions.append((token.text, exp_simple.line, exp_simple.column))
+        return token
+
+    exp_simple.on_emit.append(on_emit)
+    assert exp_simple.to_str(doc) == exp
+    assert positions == exp_positions
+
+
+def test_render_deep() -> None:
+    # NOTE: The nesting exceeds the recursion limit.
+    doc: Doc = Text("x")
+    for _ in range(5000):
+        doc = cat("(", alt(doc, "y"), ")")
+    assert SimpleDocRenderer().to_str(doc) == "(" * 5000 + "x" + ")" * 5000
@@ -1,4 +1,37 @@
-from doc_printer import Cat, SmartDocRenderer, SoftLine, Space, nest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from pytest import raises
+
+from doc_printer import (
+    Cat,
+    Doc,
+    Edit,
+    Line,
+    LineWidthExceeded,
+    Row,
+    SimpleDocRenderer,
+    SmartDocRenderer,
+    SoftLine,
+    Space,
+    Table,
+    Text,
+    TextTable,
+    TokenStream,
+    alt,
+    cat,
+    create_tables,
+    fill,
+    group,
+    inline,
+    nest,
+    row,
+    table,
+    text_table,
+)
+
+from .sections import sections
 
 
 def test_render_Alt_failing() -> None:
@@ -41,3 +74,204 @@ def test_render_Alt_Nest_failing() -> None:
         ]
     )
     assert act == exp
+
+
+def test_table_fits() -> None:
+    row1 = row("a", "bbb", "c")
+    row2 = row("aaaa", inline("b" / Line))
+    assert isinstance(row1, Row) and isinstance(row2, Row)
+    table = Table((row1, row2))
+    assert SmartDocRenderer(max_line_width=11).table_fits(table) is True
+    assert SmartDocRenderer(max_line_width=10).table_fits(table) is False
+    smart = SmartDocRenderer(max_line_width=12)
+    smart.column = 2
+    assert smart.table_fits(table) is False
+    row3 = row(nest(2, "a"))
+    assert isinstance(row3, Row)
+    assert SmartDocRenderer().table_fits(Table((row1, row3))) is None
+
+
+def test_table_fits_windows() -> None:
+    # Only the first window starts at the current column
+    row1 = row("a", align_window=1)
+    row2 = row("cccc", "d", align_window=1)
+    assert isinstance(row1, Row) and isinstance(row2, Row)
+    doc = cat("xxxxxx", alt(Line.join([row1, row2]), table(iter([row1, row2]))))
+    assert SmartDocRenderer(max_line_width=8).to_str(doc) == "xxxxxxa\ncccc d\n"
+
+
+def test_text_table_fits() -> None:
+    doc = text_table([["a", "bbb", "c"], ["aaaa", "b"]])
+    assert isinstance(doc, TextTable)
+    assert SmartDocRenderer(max_line_width=11).table_fits(doc) is True
+    assert SmartDocRenderer(max_line_width=10).table_fits(doc) is False
+    smart = SmartDocRenderer(max_line_width=12)
+    smart.column = 2
+    assert smart.table_fits(doc) is False
+
+
+def test_render_text_table_like_table() -> None:
+    rows = [["a"], ["cccccc", "d"], [], ["e"]]
+    exp_doc = table(
+        row for row in (row(*cells) for cells in rows) if isinstance(row, Row)
+    )
+    for prefix in ["", "xxxx", "xxxxxx"]:
+        for max_line_width in range(6, 14):
+            smart = SmartDocRenderer(max_line_width=max_line_width)
+            # The decision is the same, even though a TextTable is not buffered
+            assert smart.to_str(cat(prefix, alt("-", text_table(rows)))) == (
+                smart.to_str(cat(prefix, alt("-", exp_doc)))
+            )
+
+
+def test_render_create_tables() -> None:
+    rows = [row("a", "bbb", "c"), row("aaaa", "b")]
+    (doc,) = create_tables(iter(rows))
+    exp_table = "\n".join(["a    bbb c", "aaaa b", ""])
+    exp_lines = "\n".join(["a bbb c", "", "aaaa b", ""])
+    assert SmartDocRenderer(max_line_width=11).to_str(doc) == exp_table
+    assert SmartDocRenderer(max_line_width=10).to_str(doc) == exp_lines
+
+
+def test_render_deep() -> None:
+    # NOTE: The nesting exceeds the recursion limit, and every alternative
+    #       but the fallback exceeds the line width.
+    doc: Doc = Text("x")
+    for _ in range(5000):
+        doc = cat("(", alt(doc, "y" * 100), ")")
+    smart = SmartDocRenderer(max_line_width=80)
+    assert smart.to_str(doc) == "(" * 5000 + "x" + ")" * 5000
+    assert smart.position_stack == []
+    assert smart.state.on_emit_batch == []
+
+
+def test_to_strs() -> None:
+    words = SoftLine.join("01 02 03 04 05 06 07 08 09".split())
+    body = alt(nest(2, Line, words), cat(Space, words))
+    doc = Line.join(cat("label:", body) for _ in range(3))
+    max_line_widths = [12, 80, 5, 12]
+    exp = [SmartDocRenderer(max_line_width=w).to_str(doc) for w in max_line_widths]
+    assert SmartDocRenderer().to_strs(doc, max_line_widths) == exp
+
+
+def test_render_threads() -> None:
+    smart = SmartDocRenderer(max_line_width=12)
+    docs = [sections(n) for n in range(20)]
+    exp = [SmartDocRenderer(max_line_width=12).to_str(doc) for doc in docs]
+    # NOTE: Threads are switched often, so that the renders interleave.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(smart.to_str, docs * 4)) == exp * 4
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_render_interleaved() -> None:
+    smart = SmartDocRenderer(max_line_width=12)
+    docs = [sections(n) for n in range(10, 20)]
+    exp = [SmartDocRenderer(max_line_width=12).to_str(doc) for doc in docs]
+    # The renders of one renderer are interleaved, token by token, in a thread
+    token_streams = [smart.render(doc) for doc in docs]
+    texts: List[List[str]] = [[] for _ in docs]
+    running = list(range(len(docs)))
+    while running:
+        for i in list(running):
+            token = next(token_streams[i], None)
+            if token is None:
+                running.remove(i)
+            else:
+                texts[i].append(token.text)
+    assert ["".join(text) for text in texts] == exp
+
+
+def test_render_strict() -> None:
+    smart = SmartDocRenderer(max_line_width=5)
+    texts: List[str] = []
+    with raises(LineWidthExceeded), smart.strict():
+        for token in smart.render(cat("ab", "cd", "efgh", "ij")):
+            texts.append(token.text)
+    # The tokens before the first Text that does not fit are yielded
+    assert texts == ["ab", "cd"]
+
+
+def test_render_Table_align_window_first_token() -> None:
+    cells: List[str] = []
+
+    def spy(token_stream: TokenStream) -> TokenStream:
+        for token in token_stream:
+            cells.append(token.text)
+            yield token
+
+    rows = [row(Edit(spy, Text(f"a{i}")), Edit(spy, Text(f"b{i}"))) for i in range(4)]
+    doc = table((row for row in rows if isinstance(row, Row)), align_window=1)
+    for doc_renderer in (SimpleDocRenderer(), SmartDocRenderer()):
+        cells.clear()
+        assert next(iter(doc_renderer.render(doc))) == Text("a0")
+        # Only the cells of the first window are rendered before its tokens
+        assert cells == ["a0", "b0"]
+
+
+def test_render_Group() -> None:
+    args = Line.join(cat(word, ",") for word in "01 02 03".split())
+    doc = cat("f(", group(cat(Line, args, Line)), ")")
+    assert SmartDocRenderer(max_line_width=16).to_str(doc) == "f(01,02,03,)"
+    assert SmartDocRenderer(max_line_width=8).to_str(doc) == "f(\n01,\n02,\n03,\n)"
+    # Without Nests, a Group is laid out as alt(doc, inline(doc))
+    body = cat(Line, args, Line)
+    exp_doc = cat("f(", alt(body, inline(body)), ")")
+    for max_line_width in range(1, 16):
+        act = SmartDocRenderer(max_line_width=max_line_width).to_str(doc)
+        exp = SmartDocRenderer(max_line_width=max_line_width).to_str(exp_doc)
+        assert act == exp
+
+
+def test_render_Group_Nest() -> None:
+    body = cat("yy", nest(2, Line, "yy"))
+    smart = SmartDocRenderer(max_line_width=80)
+    # The flat layout of a Group drops the indentation of its Nests, which
+    # the inline layout keeps
+    assert smart.to_str(group(body)) == "yyyy"
+    assert smart.to_str(alt(body, inline(body))) == "yy  yy"
+    # The broken layouts are the same
+    smart = SmartDocRenderer(max_line_width=3)
+    assert smart.to_str(group(body)) == "yy\n  yy"
+    assert smart.to_str(alt(body, inline(body))) == "yy\n  yy"
+
+
+def test_render_Fill() -> None:
+    words = "01 02 03 04 05 06 07 08 09".split()
+    nested = [cat("(", nest(2, Line, word), ")") for word in words]
+    # A Fill is laid out as SoftLine.join(docs)
+    for docs in (words, nested):
+        doc = cat("label:", nest(2, Line, fill(docs)))
+        exp_doc = cat("label:", nest(2, Line, SoftLine.join(docs)))
+        for max_line_width in range(1, 30):
+            act = SmartDocRenderer(max_line_width=max_line_width).to_str(doc)
+            exp = SmartDocRenderer(max_line_width=max_line_width).to_str(exp_doc)
+            assert act == exp
+
+
+def test_render_budget() -> None:
+    # NOTE: Every alternative but the fallback fails once its body has been
+    #       rendered, so the render time is exponential in the depth.
+    doc: Doc = Text("x")
+    for _ in range(12):
+        doc = alt(cat("[", nest(1, Line, doc), Line, "]"), cat("[", doc, "]", "w" * 40))
+    exp = SmartDocRenderer(max_line_width=30).to_str(doc)
+    smart = SmartDocRenderer(max_line_width=30, alternatives_budget=10)
+    assert smart.to_str(doc) == exp
+    assert smart.degraded
+    assert smart.state.deadline is None
+    smart = SmartDocRenderer(max_line_width=30, time_budget=0.0)
+    assert smart.to_str(doc) == exp
+    assert smart.degraded
+    # The budget is reset by each render
+    smart = SmartDocRenderer(max_line_width=80, alternatives_budget=2)
+    assert smart.to_str(cat("a", SoftLine, "b")) == "a b"
+    assert not smart.degraded
+    assert smart.to_str(SoftLine.join("a b c d".split())) == "a b c\nd"
+    assert smart.degraded
+    assert smart.to_str(cat("a", SoftLine, "b")) == "a b"
+    assert not smart.degraded
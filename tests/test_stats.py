@@ -0,0 +1,93 @@
+from doc_printer import (
+    Doc,
+    Line,
+    RenderStats,
+    Row,
+    SimpleDocRenderer,
+    SmartDocRenderer,
+    Text,
+    alt,
+    cat,
+    doc_stats,
+    nest,
+    row,
+    table,
+    text_table,
+)
+
+DOC = Text("aaaa") / (
+    cat("(", nest(2, Line, "bbbbbbbb"), Line, ")") | cat("(", "bbbbbbbb", ")")
+)
+
+
+def test_RenderStats() -> None:
+    stats = RenderStats()
+    smart = SmartDocRenderer(max_line_width=8, stats=stats)
+    assert smart.to_str(DOC) == SmartDocRenderer(max_line_width=8).to_str(DOC)
+    assert stats.tokens_emitted == 12
+    assert stats.alts_visited == 1
+    assert stats.alternatives_tried == 1
+    assert stats.alternatives_failed == 1
+    assert stats.line_width_exceeded == 1
+    assert stats.peak_buffer_size == 2
+    assert stats.nodes["Alt"].count == 1
+    assert stats.nodes["Nest"].count == 1
+    assert [doc for doc, _ in stats.rerenders()] == []
+    assert set(stats.to_dict()) >= {"tokens_emitted", "nodes", "rerenders"}
+    assert "alts_visited: 1" in stats.summary()
+
+
+def test_RenderStats_rerenders() -> None:
+    stats = RenderStats()
+    body = nest(2, Line, "bbbbbbbb")
+    doc = cat("(", body, ")") | cat("[", body, "]")
+    SmartDocRenderer(max_line_width=4, stats=stats).to_str(doc)
+    assert (body, 1) in stats.rerenders()
+    # Equal documents that are distinct objects are not rerendered
+    stats = RenderStats()
+    doc = cat("(", nest(2, Line, "bbbbbbbb"), ")") | cat(
+        "[", nest(2, Line, "bbbbbbbb"), "]"
+    )
+    SmartDocRenderer(max_line_width=4, stats=stats).to_str(doc)
+    assert stats.rerenders() == []
+
+
+def test_RenderStats_simple() -> None:
+    stats = RenderStats()
+    SimpleDocRenderer(stats=stats).to_str(DOC)
+    assert stats.tokens_emitted == 10
+    assert stats.alts_visited == 0
+
+
+def test_doc_stats() -> None:
+    body = nest(2, Text("a") / Text("b"))
+    doc = alt(body, cat("(", body, ")"))
+    stats = doc_stats(doc)
+    assert stats.nodes == 12
+    assert stats.node_counts == {"Alt": 1, "Cat": 3, "Nest": 2, "Text": 6}
+    assert stats.max_depth == 5
+    assert stats.alts == 1
+    assert stats.max_branching == 2
+    assert stats.worst_case_alternatives == 2
+    assert stats.unique_nodes == 8
+    assert stats.shared_nodes == 1
+    assert stats.memory > 0
+
+
+def test_doc_stats_shared() -> None:
+    # The number of alternatives doubles with each level
+    doc: Doc = Text("x")
+    for _ in range(100):
+        doc = cat("[", alt(doc, cat("(", doc, ")")), "]")
+    stats = doc_stats(doc)
+    assert stats.max_depth == 202
+    assert stats.alts == 2**100 - 1
+    assert stats.worst_case_alternatives == 2**101 - 2
+    assert stats.unique_nodes < 1000
+
+
+def test_doc_stats_tables() -> None:
+    doc = text_table([["a", "b"], ["c"]]) / table(
+        row for row in (row("a"), row("b")) if isinstance(row, Row)
+    )
+    assert doc_stats(doc).tables == [(2, 2), (2, 1)]